@@ -9,8 +9,12 @@ import signal
 
 st.title("Myworkdayjobs Scraper 👋")
 progress_file = "progress.json"
-# Initialize database
-db = Database()
+# Initialize database, once per server process rather than on every rerun
+@st.cache_resource
+def get_database() -> Database:
+    return Database()
+
+db = get_database()
 
 def run_scraper(save_to_db: bool, jobserver_id: float, platform_link: str, name: str, is_test: bool, process_id: int):
     scraper = Workday(
@@ -7,3 +7,76 @@ DB_USER = os.getenv("DB_USER")
 DB_PASSWORD = os.getenv("DB_PASSWORD")
 DB_HOST = os.getenv("DB_HOST")
 DB_DATABASE = os.getenv("DB_DATABASE")
+
+# Scraper execution
+SCRAPER_WORKERS = int(os.getenv("SCRAPER_WORKERS", "4"))
+
+# HTTP client (one pooled, keep-alive client per scraper)
+HTTP_MAX_CONNECTIONS = int(os.getenv("HTTP_MAX_CONNECTIONS", "100"))
+HTTP_MAX_KEEPALIVE = int(os.getenv("HTTP_MAX_KEEPALIVE", "20"))
+HTTP_KEEPALIVE_EXPIRY = float(os.getenv("HTTP_KEEPALIVE_EXPIRY", "30"))
+HTTP_TIMEOUT = float(os.getenv("HTTP_TIMEOUT", "30"))
+HTTP_CONNECT_TIMEOUT = float(os.getenv("HTTP_CONNECT_TIMEOUT", "10"))
+HTTP_HTTP2 = os.getenv("HTTP_HTTP2", "false").lower() in ("1", "true", "yes")
+
+# Rate limiting, per host: "host=rate:burst,other.host=rate:burst"
+# rate is in requests/second. RATE_LIMIT_DEFAULT applies to undeclared hosts (0 = unlimited)
+RATE_LIMIT_DEFAULT = float(os.getenv("RATE_LIMIT_DEFAULT", "0"))
+RATE_LIMITS = {
+    host.strip(): (float(limit.split(":")[0]), int(limit.split(":")[1]) if ":" in limit else 1)
+    for host, limit in (
+        item.split("=", 1) for item in os.getenv("RATE_LIMITS", "").split(",") if "=" in item
+    )
+}
+# Starting rate for hosts that throttle us without a declared limit
+ADAPTIVE_RATE = float(os.getenv("ADAPTIVE_RATE", "5"))
+
+# Retries on timeouts, 429 and 5xx (exponential backoff with jitter, seconds)
+HTTP_RETRIES = int(os.getenv("HTTP_RETRIES", "3"))
+HTTP_BACKOFF = float(os.getenv("HTTP_BACKOFF", "1"))
+HTTP_MAX_BACKOFF = float(os.getenv("HTTP_MAX_BACKOFF", "60"))
+
+# On-disk HTTP response cache (conditional requests with ETag / Last-Modified)
+HTTP_CACHE = os.getenv("HTTP_CACHE", "true").lower() in ("1", "true", "yes")
+HTTP_CACHE_DIR = os.getenv("HTTP_CACHE_DIR", ".http_cache")
+HTTP_CACHE_MAX_AGE_DAYS = float(os.getenv("HTTP_CACHE_MAX_AGE_DAYS", "30"))
+HTTP_CACHE_MAX_MB = float(os.getenv("HTTP_CACHE_MAX_MB", "2048"))
+
+# Incremental runs: skip positions already scraped within the refresh window
+INCREMENTAL = os.getenv("INCREMENTAL", "false").lower() in ("1", "true", "yes")
+INCREMENTAL_REFRESH_DAYS = float(os.getenv("INCREMENTAL_REFRESH_DAYS", "7"))
+# Listing diff: only new or changed postings are fetched, vanished ones are closed
+LISTING_DIFF = os.getenv("LISTING_DIFF", "false").lower() in ("1", "true", "yes")
+
+# Jobs are written to MySQL in batches: flushed every DB_BATCH_SIZE jobs or DB_FLUSH_INTERVAL seconds
+DB_BATCH_SIZE = int(os.getenv("DB_BATCH_SIZE", "100"))
+DB_FLUSH_INTERVAL = float(os.getenv("DB_FLUSH_INTERVAL", "5"))
+
+# SQLAlchemy connection pool, shared by every Database of the process
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "5"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+DB_POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", "30"))
+# Below MySQL's wait_timeout so idle connections are never used after the server dropped them
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "1800"))
+
+# Progress is written to scraper.db at most every PROGRESS_INTERVAL seconds or PROGRESS_EVERY jobs
+PROGRESS_INTERVAL = float(os.getenv("PROGRESS_INTERVAL", "2"))
+PROGRESS_EVERY = int(os.getenv("PROGRESS_EVERY", "25"))
+# Jobs waiting for the background writer, scrapers block when the queue is full
+DB_QUEUE_SIZE = int(os.getenv("DB_QUEUE_SIZE", "1000"))
+
+# Batch validation: processes for the text enrichment (0 = one per CPU, 1 = no pool)
+ENRICH_PROCESSES = int(os.getenv("ENRICH_PROCESSES", "0"))
+# Smaller batches are enriched in-process, pickling would cost more than it saves
+ENRICH_MIN_BATCH = int(os.getenv("ENRICH_MIN_BATCH", "64"))
+
+# Country detection cache: entries kept in memory, and an optional JSON file kept between runs
+LOCATION_CACHE_SIZE = int(os.getenv("LOCATION_CACHE_SIZE", "10000"))
+LOCATION_CACHE_FILE = os.getenv("LOCATION_CACHE_FILE", "")
+
+# Offline gazetteer built by scripts/build_gazetteer.py (countries and regions from pycountry when missing)
+GAZETTEER_FILE = os.getenv("GAZETTEER_FILE", "gazetteer.bin")
+
+# scripts/runner.py: requests in flight across every tenant, and tenants scraped at the same time
+RUNNER_CONCURRENCY = int(os.getenv("RUNNER_CONCURRENCY", "32"))
+RUNNER_TENANTS = int(os.getenv("RUNNER_TENANTS", "8"))
@@ -6,6 +6,8 @@ args.add_argument('--save', choices=['yes', 'no'], default="no")
 args.add_argument('--name', type=str, required=True)
 args.add_argument('--id', type=int, required=True)
 args.add_argument('--user_link', type=str)
+args.add_argument('--incremental', action='store_true', help="Skip the positions scraped within INCREMENTAL_REFRESH_DAYS")
+args.add_argument('--diff', action='store_true', help="Only fetch the postings added or changed since the last listing, close the removed ones")
 parsed = args.parse_args()
 
 if __name__ == "__main__":
@@ -38,9 +40,13 @@ if __name__ == "__main__":
                 user_link=parsed.user_link,
                 name=parsed.name,
             ) 
+            scraper.incremental = scraper.incremental or parsed.incremental
+            scraper.listing_diff = scraper.listing_diff or parsed.diff
             scraper.main()
         else:
             scraper = target_class(save=True if parsed.save == 'yes' else False, companyid=parsed.id) 
+            scraper.incremental = scraper.incremental or parsed.incremental
+            scraper.listing_diff = scraper.listing_diff or parsed.diff
             scraper.main()
     else:
         print(f"Error: No class found for {parsed.name}")
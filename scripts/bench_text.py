@@ -0,0 +1,248 @@
+"""Benchmark of the text enrichment helpers against the previous implementations.
+
+    python scripts/bench_text.py                    # generated corpus
+    python scripts/bench_text.py --corpus jobs.json # JSON list of descriptions, or one per line
+    python scripts/bench_text.py --db 2000          # last descriptions stored in MySQL
+
+Every description is also checked to give the same result with both versions.
+"""
+import sys
+sys.path.append('.')
+
+import json
+import random
+import re
+import time
+from argparse import ArgumentParser
+from src.utils import static
+from src.utils import qualifications
+from src.utils.experience import extract_year_range, extract_years
+from src.utils.qualifications import extract_qualification
+from src.utils.text import normalize_text
+
+
+# ------------------------------------------------
+# Previous implementations, kept as the reference
+def legacy_extract_qualifications(jobdescription: str) -> str:
+    if not jobdescription:
+        return "General"
+    desc_normalized = normalize_text(jobdescription).lower()
+    for qualification in static.qualifications:
+        qual_lower = normalize_text(qualification).lower()
+        if qual_lower in desc_normalized:
+            return qualification
+        main_part = qual_lower.split("(")[0].strip()
+        main_keyword = main_part.replace("'s", "").replace("'s", "").strip()
+        if len(main_keyword) > 3 and f" {main_keyword} " in f" {desc_normalized} ":
+            return qualification
+    custom_mappings = [
+        ("high school diploma", "High School (S.S.C.E)"),
+        ("high school diploma or ged", "High School (S.S.C.E)"),
+        ("high school diploma or g.e.d", "High School (S.S.C.E)"),
+        ("ged", "High School (S.S.C.E)"),
+        ("g.e.d", "High School (S.S.C.E)"),
+        ("secondary school", "High School (S.S.C.E)"),
+        ("high school certificate", "High School (S.S.C.E)"),
+        ("ssce", "High School (S.S.C.E)"),
+        ("associate degree", "Associate"),
+        ("associates degree", "Associate"),
+        ("associate's", "Associate"),
+        ("associate", "Associate"),
+        ("bachelor's", "Bachelor's (B.A.)"),
+        ("bachelors", "Bachelor's (B.A.)"),
+        ("bachelor's degree", "Bachelor's (B.A.)"),
+        ("bachelor degree", "Bachelor's (B.A.)"),
+        ("bachelor of arts", "Bachelor's (B.A.)"),
+        ("bachelor of science", "Bachelor's (B.Sc.)"),
+        ("bachelor of commerce", "Bachelor's (B.Com.)"),
+        ("bachelor of engineering", "Bachelor's (B.Eng.)"),
+        ("bachelor of education", "Bachelor's (B.Ed.)"),
+        ("bachelor of laws", "Bachelor's (LLB)"),
+        ("bachelor of laws", "Bachelor's (LLB)"),
+    ]
+    for keyword, qualification in custom_mappings:
+        if keyword in desc_normalized:
+            if qualification in static.qualifications:
+                return qualification
+    return "General"
+
+
+def legacy_extract_years(text: str) -> list[int]:
+    years_found = []
+    for match in re.finditer(r"(\d+)\s+or\s+more\s+years?", text):
+        years_found.append(int(match.group(1)))
+    for match in re.finditer(r"(\d+)(?:\s*[-–—]\s*(\d+))?(?:\+)?\s+years?", text):
+        if "or more" not in match.group(0):
+            first_year = int(match.group(1))
+            second_year = int(match.group(2)) if match.group(2) else None
+            years_found.append(max(first_year, second_year) if second_year else first_year)
+    return years_found
+
+
+def legacy_verizon_experience(jobdescription: str) -> str:
+    mapping = {
+        "one": "1", "two": "2", "three": "3", "four": "4", "five": "5",
+        "six": "6", "seven": "7", "eight": "8", "nine": "9", "ten": "10",
+        "eleven": "11", "twelve": "12", "thirteen": "13", "fourteen": "14",
+        "fifteen": "15", "sixteen": "16", "seventeen": "17", "eighteen": "18",
+        "nineteen": "19", "twenty": "20"
+    }
+    if not jobdescription:
+        return "No Experience"
+    text = normalize_text(jobdescription).lower()
+    for word, digit in mapping.items():
+        text = re.sub(r'\b' + word + r'\b', digit, text, flags=re.IGNORECASE)
+    for experience in static.experienceLevels:
+        if normalize_text(experience).lower() in text:
+            return experience
+    years_found = legacy_extract_years(text)
+    if years_found:
+        valid_years = [y for y in years_found if 0 < y < 40]
+        if not valid_years:
+            return "No Experience"
+        years = max(valid_years)
+        return "> 20 years" if years >= 20 else (f"{years} year" if years == 1 else f"{years} years")
+    for keyword in ("entry level", "graduate"):
+        if keyword in text:
+            return "No Experience"
+    return "No Experience"
+
+
+def verizon_experience(jobdescription: str) -> str:
+    from src.scrapers.verizon import Verizon
+    return Verizon._extract_experience(Verizon.__new__(Verizon), jobdescription)
+
+
+def legacy_year_range(text: str):
+    match = re.search(r"(\d+)\s*-\s*(\d+)\s+years", (text or "").lower())
+    return (int(match.group(1)), int(match.group(2))) if match else None
+
+
+# ------------------------------------------------
+FILLER = (
+    "we are looking for a motivated engineer to join our team and build reliable services "
+    "you will collaborate with product managers designers and other engineers across the company "
+    "strong communication skills and ownership are expected competitive benefits and hybrid work "
+).split()
+SNIPPETS = [
+    "Bachelor's degree in Computer Science", "bachelors in finance", "a Master's (M.Sc.) is a plus",
+    "MBA preferred", "PhD in statistics", "High School Diploma or GED", "associate degree",
+    "Bachelor of Engineering", "postgraduate diploma", "HND or OND", "vocational training",
+    "5+ years of experience", "3-5 years of relevant experience", "two years of experience",
+    "10 or more years in a similar role", "minimum of 7 years", "no degree required", "",
+]
+
+
+def generated_corpus(size: int) -> list[str]:
+    rng = random.Random(42)
+    corpus = []
+    for _ in range(size):
+        words = [rng.choice(FILLER) for _ in range(rng.randint(200, 900))]
+        for snippet in rng.sample(SNIPPETS, 3):
+            words.insert(rng.randrange(len(words)), snippet)
+        corpus.append(" ".join(words))
+    return corpus
+
+
+def load_corpus(path: str) -> list[str]:
+    with open(path, encoding="utf-8") as f:
+        content = f.read()
+    try:
+        data = json.loads(content)
+    except ValueError:
+        return [line for line in content.splitlines() if line.strip()]
+    return [item["jobdescription"] if isinstance(item, dict) else item for item in data]
+
+
+def db_corpus(limit: int) -> list[str]:
+    from sqlmodel import Session, select
+    from src.storage.database import Database
+    from src.storage.model import jobs
+
+    with Session(bind=Database().engine) as session:
+        return list(session.exec(select(jobs.jobdescription).limit(limit)).all())
+
+
+def scraper():
+    from src.scrapers.base.base_scraper import BaseScraper
+
+    class Bench(BaseScraper):
+        def get_positions(self):
+            return []
+
+        def get_position_details(self, position_link: str) -> dict:
+            return {}
+
+    return Bench(save=False, name="bench", link="", process_id=0, companyid=0)
+
+
+def compare_batch(corpus: list[str], repeat: int) -> None:
+    bench_scraper = scraper()
+    details = [
+        {"companyid": 0, "jobposition": "Engineer", "jobdescription": text, "scrapedsource": f"https://example.com/{i}"}
+        for i, text in enumerate(corpus)
+    ]
+    single = [bench_scraper.validate_data(job).model_dump() for job in details]
+    batch = [job.model_dump() for job in bench_scraper.validate_many(details)]
+    if single != batch:
+        print(f"❌ validate_many: {sum(a != b for a, b in zip(single, batch))} different jobs")
+    old = bench("validate_data (one by one)", lambda job: bench_scraper.validate_data(job), details, repeat)
+    start = time.perf_counter()
+    for _ in bench_scraper.validate_many(details):
+        pass
+    print(f"{'validate_many (warm-up)':<40} {(time.perf_counter() - start) * 1000:9.1f} ms")
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in bench_scraper.validate_many(details):
+            pass
+        best = min(best, time.perf_counter() - start)
+    print(f"{'validate_many':<40} {best * 1000:9.1f} ms  ({best / len(details) * 1e6:7.1f} us/job)")
+    print(f"{'':<40} x{old / best:.1f}\n")
+
+
+def bench(name: str, func, corpus: list[str], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for text in corpus:
+            func(text)
+        best = min(best, time.perf_counter() - start)
+    print(f"{name:<40} {best * 1000:9.1f} ms  ({best / len(corpus) * 1e6:7.1f} us/job)")
+    return best
+
+
+def compare(name: str, legacy, current, corpus: list[str], repeat: int, same: bool = True) -> None:
+    """same=False when the new version is expected to find more (number words, "Years")"""
+    mismatches = [text for text in corpus if legacy(text) != current(text)]
+    if mismatches:
+        print(f"{'❌' if same else 'ℹ️ '} {name}: {len(mismatches)} different results, first one:")
+        print(f"   {mismatches[0][:200]!r}\n   {legacy(mismatches[0])!r} != {current(mismatches[0])!r}")
+    old = bench(f"{name} (legacy)", legacy, corpus, repeat)
+    new = bench(f"{name} (compiled)", current, corpus, repeat)
+    print(f"{'':<40} x{old / new:.1f}\n")
+
+
+if __name__ == "__main__":
+    args = ArgumentParser()
+    args.add_argument("--corpus", type=str, help="JSON list of descriptions or one description per line")
+    args.add_argument("--db", type=int, help="Load this many descriptions from the jobs table")
+    args.add_argument("--size", type=int, default=2000, help="Size of the generated corpus")
+    args.add_argument("--repeat", type=int, default=3)
+    parsed = args.parse_args()
+
+    if parsed.corpus:
+        corpus = load_corpus(parsed.corpus)
+    elif parsed.db:
+        corpus = db_corpus(parsed.db)
+    else:
+        corpus = generated_corpus(parsed.size)
+    print(f"{len(corpus)} descriptions, {sum(map(len, corpus)) / len(corpus):.0f} characters on average\n")
+
+    backend = "pyahocorasick" if qualifications.AUTOMATON is not None else "keyword table"
+    print(f"qualification matcher: {backend}")
+    compare("qualifications", legacy_extract_qualifications, extract_qualification, corpus, parsed.repeat)
+    compare("years (validate_data)", legacy_extract_years, extract_years, corpus, parsed.repeat, same=False)
+    compare("experience (Verizon)", legacy_verizon_experience, verizon_experience, corpus, parsed.repeat, same=False)
+    compare("year range (Coinbase, BoA)", legacy_year_range, extract_year_range, corpus, parsed.repeat, same=False)
+    compare_batch(corpus, parsed.repeat)
@@ -0,0 +1,47 @@
+"""Build the offline gazetteer used by src.utils.gazetteer.normalize_location.
+
+    python scripts/build_gazetteer.py                   # every country known to pgeocode
+    python scripts/build_gazetteer.py --countries US,GB,FR,DE,IN,NG
+
+Countries and their regions come from pycountry, cities from the GeoNames
+postal code files of pgeocode (downloaded once into its cache, the only step
+that needs the network). Scrapers only read the resulting file.
+"""
+import sys
+sys.path.append('.')
+
+import time
+from argparse import ArgumentParser
+import pgeocode
+from src.utils.gazetteer import CITY, Gazetteer, normalize_name, pycountry_records
+from config.config import GAZETTEER_FILE
+
+
+def city_records(country_codes: list[str]):
+    for code in country_codes:
+        try:
+            # pgeocode keeps the whole GeoNames file in _data
+            data = pgeocode.Nominatim(code)._data
+        except Exception as e:
+            print(f"Skipping {code}: {e}")
+            continue
+        places = data[["place_name", "state_name"]].dropna(subset=["place_name"]).drop_duplicates()
+        print(f"{code} - {len(places)} places")
+        for place_name, state_name in places.itertuples(index=False):
+            region = state_name if isinstance(state_name, str) else ""
+            yield normalize_name(place_name), CITY, code, place_name, region
+
+
+if __name__ == "__main__":
+    args = ArgumentParser()
+    args.add_argument("--countries", type=str, help="Comma separated ISO codes, all pgeocode countries by default")
+    args.add_argument("--output", type=str, default=GAZETTEER_FILE)
+    parsed = args.parse_args()
+
+    countries = parsed.countries.upper().split(",") if parsed.countries else sorted(pgeocode.COUNTRIES_VALID)
+    start = time.perf_counter()
+    records = list(pycountry_records())
+    records.extend(city_records(countries))
+    gazetteer = Gazetteer.from_records(records)
+    gazetteer.save(parsed.output)
+    print(f"{len(gazetteer.keys)} names written to {parsed.output} in {time.perf_counter() - start:.1f}s")
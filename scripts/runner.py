@@ -1 +1,85 @@
+"""Scrape many Workday tenants in one process.
 
+    python scripts/runner.py tenants.csv --save yes
+
+tenants.csv has one "link,companyid" line per tenant (blank lines and lines
+starting with # are ignored):
+
+    https://acme.wd5.myworkdayjobs.com/en-US/External,42
+
+Every tenant runs on the same event loop with one HTTP connection pool, one
+job writer and one request budget. Each tenant keeps its own progress row
+in scraper.db (Workday-<tenant>) and its own per-host rate limit.
+"""
+import sys
+sys.path.append('.')
+
+import asyncio
+import csv
+import os
+from argparse import ArgumentParser
+from src.scrapers.workdayjobs import Workday
+from src.utils.http_client import create_async_client
+from config.config import RUNNER_CONCURRENCY, RUNNER_TENANTS
+
+
+def read_tenants(path: str) -> list[tuple[str, int]]:
+    tenants = []
+    with open(path, newline="") as f:
+        for row in csv.reader(f):
+            if not row or not row[0].strip() or row[0].lstrip().startswith("#"):
+                continue
+            link, companyid = row[0].strip(), row[1].strip()
+            tenants.append((link, int(companyid)))
+    return tenants
+
+
+async def run_tenant(scraper: Workday, client, limit: asyncio.Semaphore, tenant_slots: asyncio.Semaphore) -> str:
+    async with tenant_slots:
+        try:
+            await scraper.amain(client, limit=limit)
+            return "completed"
+        except Exception as e:
+            # amain() already recorded the failure, the other tenants go on
+            print(f"❌ {scraper.name} - {str(e)}")
+            return "failed"
+
+
+async def run(tenants: list[tuple[str, int]], save: bool, concurrency: int, parallel_tenants: int, incremental: bool, is_test: bool) -> dict[str, str]:
+    scrapers = []
+    for link, companyid in tenants:
+        scraper = Workday(
+            save=save,
+            name="",
+            user_link=link,
+            companyid=companyid,
+            # The Stop button of app.py stops the whole batch
+            process_id=os.getpid(),
+            is_test=is_test,
+        )
+        scraper.incremental = scraper.incremental or incremental
+        scrapers.append(scraper)
+
+    limit = asyncio.Semaphore(max(1, concurrency))
+    tenant_slots = asyncio.Semaphore(max(1, parallel_tenants))
+    async with create_async_client(max_connections=concurrency, max_keepalive=concurrency) as client:
+        results = await asyncio.gather(*[run_tenant(scraper, client, limit, tenant_slots) for scraper in scrapers])
+    return {scraper.name: result for scraper, result in zip(scrapers, results)}
+
+
+if __name__ == "__main__":
+    args = ArgumentParser()
+    args.add_argument("tenants", type=str, help="CSV file of link,companyid lines")
+    args.add_argument("--save", choices=["yes", "no"], default="no")
+    args.add_argument("--concurrency", type=int, default=RUNNER_CONCURRENCY, help="Requests in flight across all tenants")
+    args.add_argument("--parallel-tenants", type=int, default=RUNNER_TENANTS, help="Tenants scraped at the same time")
+    args.add_argument("--incremental", action="store_true")
+    args.add_argument("--test", action="store_true", help="First listing page of each tenant only")
+    parsed = args.parse_args()
+
+    tenants = read_tenants(parsed.tenants)
+    print(f"{len(tenants)} tenants")
+    results = asyncio.run(run(tenants, parsed.save == "yes", parsed.concurrency, parsed.parallel_tenants, parsed.incremental, parsed.test))
+    for name, result in results.items():
+        print(f"{name} - {result}")
+    print(f"{sum(result == 'completed' for result in results.values())}/{len(results)} tenants completed")
@@ -1,11 +1,12 @@
-from datetime import datetime
-from urllib.parse import urljoin
+import threading
+from urllib.parse import urljoin, urlparse
 from xml.etree import ElementTree as ET
 
 import cloudscraper
 from selectolax.parser import HTMLParser
 
 from src.scrapers.base.base_scraper import BaseScraper
+from src.utils.rate_limiter import rate_limiter
 
 
 class Adidas(BaseScraper):
@@ -17,10 +18,24 @@ class Adidas(BaseScraper):
             companyid=companyid,
             save=save
         )
+        # Une session cloudscraper par thread (keep-alive), elles ne sont pas thread-safe
+        self._sessions = threading.local()
+
+    @property
+    def scraper(self) -> cloudscraper.CloudScraper:
+        """cloudscraper session of the calling thread"""
+        session = getattr(self._sessions, "session", None)
+        if session is None:
+            session = self._sessions.session = cloudscraper.create_scraper()
+        return session
 
     def _get_html_adidas(self, url: str) -> str:
-        scraper = cloudscraper.create_scraper()
-        response = scraper.get(url, timeout=30)
+        def get():
+            # cloudscraper bypasses the httpx client, wait for the host rate limiter here
+            rate_limiter.acquire(url)
+            return self.scraper.get(url, timeout=30)
+
+        response = self.retry_policy.run(get, urlparse(url).netloc)
         response.raise_for_status()
         return response.text
 
@@ -101,7 +116,6 @@ class Adidas(BaseScraper):
 
         # Données de base du job_dict
         job_dict = {
-            "jobid": int(datetime.now().timestamp()),
             "companyid": self.companyid,
             "jobposition": jobposition,
             "jobdescription": jobdescription,
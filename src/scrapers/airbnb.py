@@ -1,4 +1,3 @@
-import time
 from urllib.parse import urljoin
 
 from selectolax.parser import HTMLParser
@@ -7,6 +6,8 @@ from src.scrapers.base.base_scraper import BaseScraper
 
 
 class Airbnb(BaseScraper):
+    rate_limit = (1.5, 1)
+
     def __init__(self, save: bool) -> None:
         super().__init__(
             name="Airbnb",
@@ -42,7 +43,6 @@ class Airbnb(BaseScraper):
                         position_links.append(full_url)
 
             page += 1
-            time.sleep(0.7)
 
         print(f"TOTAL OFFRES AIRBNB : {len(position_links)}")
         return position_links
@@ -1,6 +1,5 @@
-from datetime import datetime
-import httpx
-from src.scrapers.base.base_scraper import BaseScraper
+from collections.abc import AsyncIterator
+from src.scrapers.base.async_base_scraper import AsyncBaseScraper
 
 cookies = {
     'jobs': '07158c1e454930789e2005e0f1ec2e71',
@@ -39,13 +38,12 @@ headers = {
     'Priority': 'u=4',
 }
 
-class Apple(BaseScraper):
+class Apple(AsyncBaseScraper):
     def __init__(self, save: bool) -> None:
         super().__init__(name = "Apple", link="https://jobs.apple.com/en-us/search", companyid=21, domain="https://jobs.apple.com", save=save)
 
 
-    def get_positions(self) -> list[str]:
-        position_links = []
+    async def get_positions(self) -> AsyncIterator[dict]:
         page = 1
         while True:
             print(f'Page - {page}')
@@ -61,40 +59,50 @@ class Apple(BaseScraper):
                 },
             }
 
-            response = httpx.post('https://jobs.apple.com/api/v1/search', cookies=cookies, headers=headers, json=payload)
+            response = await self.client.post('https://jobs.apple.com/api/v1/search', cookies=cookies, headers=headers, json=payload)
             response.raise_for_status()
             json_data = response.json()
 
             job_data = json_data['res']
             jobs = job_data['searchResults']
             for job in jobs:
-                position_links.append(f"https://jobs.apple.com/api/v1/jobDetails/{job['positionId']}?locale=en-us")
+                yield job
 
             if len(jobs) == 0:
                 break
 
             page += 1
-        return position_links
 
+    @staticmethod
+    def _details_url(job: dict) -> str:
+        return f"https://jobs.apple.com/api/v1/jobDetails/{job['positionId']}?locale=en-us"
 
+    @staticmethod
+    def _job_link(job: dict) -> str:
+        return f"https://jobs.apple.com/en-us/details/{job['positionId']}/{job['transformedPostingTitle']}"
 
-    def get_position_details(self, position_link: str) -> dict:
-        response = httpx.get(position_link)
+    def position_key(self, job: dict) -> str:
+        return self._job_link(job)
+
+    @staticmethod
+    def _location(locations: list[dict]) -> tuple[str, str]:
+        location = locations[0] if locations else {}
+        job_address = f"{location.get('city', '')} {location.get('cityProvince', '')}".strip()
+        return job_address, location.get('countryName', '')
+
+    async def get_position_details(self, job: dict) -> dict:
+        response = await self.client.get(self._details_url(job))
         response.raise_for_status()
         json_data = response.json()
 
         position_data = json_data['res']
         jobposition = position_data['postingTitle']
         category = position_data['teamNames'][0]
-        location = position_data['locations'][0]
-        job_address = f"{location.get('city', '')} {location.get('cityProvince', '')}".strip()
-        country = location['countryName']
+        job_address, country = self._location(position_data['locations'])
         job_description = f"{position_data['jobSummary']} {position_data['description']} {position_data['preferredQualifications']} {position_data['minimumQualifications']}"
         job_type = position_data['jobType']
-        job_link = f"https://jobs.apple.com/en-us/details/{position_data['jobNumber']}/{position_data['transformedPostingTitle']}"
 
         job_dict = {
-            "jobid": int(datetime.now().timestamp()),
             "companyid": self.companyid,
             "jobposition": jobposition,
             "jobdescription": job_description,
@@ -102,6 +110,6 @@ class Apple(BaseScraper):
             "jobcountry": country,
             "jobaddress": job_address,
             "jobpattern": job_type,
-            "scrapedsource": job_link,
+            "scrapedsource": self._job_link(job),
         }
         return job_dict
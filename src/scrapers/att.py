@@ -1,9 +1,8 @@
 from urllib.parse import urljoin
-from datetime import datetime
-import json
 import re
 from selectolax.parser import HTMLParser
 from src.scrapers.base.base_scraper import BaseScraper
+from src.scrapers.base.extractors import extract_json_ld
 
 
 class ATT(BaseScraper):
@@ -52,15 +51,7 @@ class ATT(BaseScraper):
 
     def get_position_details(self, position_link: str) -> dict:
         html = self.get_html(position_link)
-        soup = HTMLParser(html)
-
-        json_ld_script = soup.css_first('script[type="application/ld+json"]')
-        json_data = None
-        if json_ld_script:
-            try:
-                json_data = json.loads(json_ld_script.text())
-            except json.JSONDecodeError:
-                pass
+        json_data = extract_json_ld(html)
 
         jobposition = json_data.get("title", "") if json_data else ""
         
@@ -121,7 +112,7 @@ class ATT(BaseScraper):
         job_id = json_data.get("identifier", "") if json_data else ""
 
         job_dict = {
-            "jobid": job_id if job_id else int(datetime.now().timestamp()),
+            "jobid": job_id,
             "companyid": self.companyid,
             "jobposition": jobposition,
             "jobdescription": jobdescription,
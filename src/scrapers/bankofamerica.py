@@ -1,8 +1,9 @@
+from collections.abc import Iterator
 from src.scrapers.base.base_scraper import BaseScraper
 from selectolax.parser import HTMLParser
 from urllib.parse import urljoin
-from datetime import datetime
 import re
+from src.utils.experience import extract_year_range
 
 
 class BankOfAmerica(BaseScraper):
@@ -16,8 +17,9 @@ class BankOfAmerica(BaseScraper):
         )
 
 
-    def get_positions(self) -> list[str]:
-        position_links = []
+    def get_positions(self) -> Iterator[str]:
+        # Générateur : main() commence les pages détail pendant la pagination
+        position_links = set()
         offset = 0
         rows = 2000 #Editer pour tout obtenir 
         
@@ -27,7 +29,7 @@ class BankOfAmerica(BaseScraper):
             try:
                 html = self.get_html(url)
             except Exception as e:
-                print(f"Error fetching page {offset}: {e} -> Stopping.")
+                self._page_failed(offset, f"{e} -> Stopping.")
                 break
                 
             soup = HTMLParser(html)
@@ -43,11 +45,10 @@ class BankOfAmerica(BaseScraper):
                     continue
                 position_link = urljoin(self.domain, href) if self.domain else href
                 if position_link not in position_links:
-                    position_links.append(position_link)
+                    position_links.add(position_link)
+                    yield position_link
             
             offset += rows
-            
-        return position_links
 
 
     def get_position_details(self, position_link: str) -> dict:
@@ -116,16 +117,14 @@ class BankOfAmerica(BaseScraper):
 
         # Mapping des formats d'expérience du type "x-y years" -> on garde "y years"
         jobexperience = ""
-        text_lower = (jobdescription or "").lower()
         # Exemple dans la page : "4-8 years of experience in Global Markets"
-        range_match = re.search(r"(\d+)\s*-\s*(\d+)\s+years", text_lower)
-        if range_match:
-            last_year = range_match.group(2)
-            jobexperience = f"{last_year} years"
+        year_range = extract_year_range(jobdescription)
+        if year_range:
+            jobexperience = f"{year_range[1]} years"
 
         # Données de base du job_dict
         job_dict = {
-            "jobid": int(jobid) if jobid and jobid.isdigit() else int(datetime.now().timestamp()),
+            "jobid": jobid,
             "companyid": self.companyid,
             "jobposition": jobposition,
             "jobdescription": jobdescription,
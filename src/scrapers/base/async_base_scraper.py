@@ -0,0 +1,187 @@
+import asyncio
+import inspect
+from abc import abstractmethod
+from contextlib import asynccontextmanager
+from collections.abc import AsyncIterable, AsyncIterator, Awaitable, Callable, Iterable, Sized
+import httpx
+from src.scrapers.base.base_scraper import BaseScraper, _RunState
+from src.storage.model import jobs
+from src.utils.http_client import create_async_client
+
+
+class AsyncBaseScraper(BaseScraper):
+    """Base class for scrapers whose hooks are coroutines.
+
+    Every request goes through one httpx.AsyncClient, so a single event loop
+    can keep many detail pages in flight. main() stays synchronous so the
+    scrapers can still be started from main.py and app.py.
+    """
+
+    def __init__(self, save: bool, name: str, link: str, process_id: int, companyid: int, domain: str = "", is_test: bool = False) -> None:
+        super().__init__(
+            save=save,
+            name=name,
+            link=link,
+            process_id=process_id,
+            companyid=companyid,
+            domain=domain,
+            is_test=is_test,
+        )
+
+    # Request budget shared with other scrapers of the process, set by amain()
+    shared_limit: asyncio.Semaphore | None = None
+
+    def _create_client(self) -> None:
+        # The async client is bound to the event loop, it is created in amain()
+        return None
+
+
+    async def get_html(self, url: str) -> str:
+        """Extract the html from a url"""
+        response = await self.client.get(url)
+        print(response)
+        print(response.url)
+        response.raise_for_status()
+        return response.text
+
+
+    @abstractmethod
+    async def get_positions(self) -> Iterable | AsyncIterable:
+        """Extract the position links (a list or an async generator)"""
+        pass
+
+    @abstractmethod
+    async def get_position_details(self, position) -> dict:
+        """Extract position details"""
+        pass
+
+
+    @staticmethod
+    async def _iterate(positions: Iterable | AsyncIterable) -> AsyncIterator:
+        if isinstance(positions, AsyncIterable):
+            async for position in positions:
+                yield position
+        else:
+            for position in positions:
+                yield position
+
+    @asynccontextmanager
+    async def _slot(self, semaphore: asyncio.Semaphore) -> AsyncIterator[None]:
+        """One request: a slot of the scraper's own limit, then of the shared budget"""
+        async with semaphore:
+            if self.shared_limit is None:
+                yield
+            else:
+                async with self.shared_limit:
+                    yield
+
+    async def _fetch_pages(self, fetch_page: Callable[[int], Awaitable[list]], offsets: Iterable[int]) -> AsyncIterator[list]:
+        """Fetch listing pages concurrently (at most `workers` at once), in completion order.
+
+        Used once the first page gave the total, so every offset is known. A
+        failed page is reported and skipped, see _page_failed().
+        """
+        semaphore = asyncio.Semaphore(max(1, self.workers))
+
+        async def fetch(offset: int) -> list:
+            async with self._slot(semaphore):
+                try:
+                    return await fetch_page(offset)
+                except Exception as e:
+                    self._page_failed(f"offset {offset}", e)
+                    return []
+
+        for page in asyncio.as_completed([fetch(offset) for offset in offsets]):
+            yield await page
+
+    async def _fetch_position(self, position, semaphore: asyncio.Semaphore) -> jobs:
+        async with self._slot(semaphore):
+            job_details = await self.get_position_details(position)
+        # Enrichment is CPU work, it must not hold up the other requests of the loop
+        return await asyncio.to_thread(self.validate_data, job_details)
+
+
+    async def _aprogress(self, total: int, current: int, successful: int, failed: int, status: str) -> None:
+        """_progress() with the database write off the event loop"""
+        data = self._progress_update(total, current, successful, failed, status)
+        if data is not None:
+            await asyncio.to_thread(self._update_progress, data)
+
+
+    async def amain(self, client: httpx.AsyncClient | None = None, limit: asyncio.Semaphore | None = None) -> None:
+        """Run the scraper inside an existing event loop.
+
+        A client can be passed to share its connection pool between several
+        scrapers running in the same process, and a semaphore to share a
+        request budget: each scraper still keeps at most `workers` requests
+        in flight, so one large site cannot take the whole budget. Database
+        reads and writes, and job validation, run in threads: they never hold
+        up the other scrapers.
+        """
+        print(self.name)
+        status = "running"
+        run = _RunState(self)
+
+        owns_client = client is None
+        self.shared_limit = limit
+        self.client = client or create_async_client(**self._http_options())
+
+        await self._aprogress(*run.counters(), status)
+
+        try:
+            positions = self.get_positions()
+            if inspect.isawaitable(positions):
+                positions = await positions
+            positions = await asyncio.to_thread(lambda: self._skip_known(self._diff_listing(positions)))
+            run.streaming = not isinstance(positions, Sized)
+            run.total = 0 if run.streaming else len(positions)
+            await self._aprogress(run.total, 0, 0, 0, "running")
+
+            semaphore = asyncio.Semaphore(max(1, self.workers))
+            window = max(1, self.workers) * 2
+
+            async def collect() -> None:
+                done, _ = await asyncio.wait(run.pending, return_when=asyncio.FIRST_COMPLETED)
+                # send_job waits when the writer queue is full
+                await asyncio.to_thread(run.collect, done)
+                await self._aprogress(*run.counters(), "running")
+
+            async for position in self._iterate(positions):
+                if run.add(position):
+                    run.pending[asyncio.create_task(self._fetch_position(position, semaphore))] = position
+                elif run.listing_full():
+                    await asyncio.to_thread(run.save_listing)
+                    await self._aprogress(*run.counters(), "running")
+                while len(run.pending) >= window:
+                    await collect()
+
+            await asyncio.to_thread(run.save_listing)
+            while run.pending:
+                await collect()
+
+            status = "completed"
+
+        except (KeyboardInterrupt, asyncio.CancelledError):
+            print("\n⚠️  Interrupted!")
+            status = "interrupted"
+            raise
+
+        except Exception as e:
+            print(f"\n❌ Fatal error: {str(e)}")
+            status = "failed"
+            raise
+
+        finally:
+            for task in run.pending:
+                task.cancel()
+            if owns_client:
+                await self.client.aclose()
+            status = await asyncio.to_thread(self._drain_jobs, status, run)
+            await asyncio.to_thread(self._save_scraped_keys)
+            await asyncio.to_thread(self._save_snapshot, status)
+            # ALWAYS saves progress, even if something crashes
+            await self._aprogress(*run.counters(), status)
+
+
+    def main(self) -> None:
+        asyncio.run(self.amain())
@@ -1,13 +1,102 @@
 from abc import abstractmethod
+from collections import Counter
+from collections.abc import AsyncIterable, Iterable, Iterator, Sized
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 import httpx
 from src.storage.database import Database
 from src.storage.model import jobs, scraperStatus
 from src.utils import static
-import re
+from src.utils.enrichment import enrich_many, enrich_text
+from src.utils.experience import extract_years
+from src.utils.gazetteer import normalize_location
+from src.utils.http_client import create_client
+from src.utils.jobid import canonical_source, job_fingerprint, make_jobid
+from src.utils.qualifications import extract_qualification
+from src.utils.rate_limiter import rate_limiter
+from src.utils.retry import RetryPolicy
+from src.utils.text import normalize_text
+from urllib.parse import urlparse
+from config.config import HTTP_MAX_KEEPALIVE, INCREMENTAL, INCREMENTAL_REFRESH_DAYS, LISTING_DIFF, PROGRESS_EVERY, PROGRESS_INTERVAL, SCRAPER_WORKERS
+import json
+import os
+import time
 from datetime import datetime
+from hashlib import blake2b
+
+
+class _RunState:
+    """Counters, listing batch and pending detail fetches of one main() or amain() run.
+
+    main() and amain() only differ in how they submit and wait for the fetches,
+    a fetch being a Future or a Task mapped to its position.
+    """
+
+    def __init__(self, scraper: "BaseScraper") -> None:
+        self.scraper = scraper
+        self.total = 0
+        self.idx = 0
+        self.successful = 0
+        self.failed = 0
+        self.streaming = False
+        self.listing_batch: list[tuple[object, dict]] = []
+        self.pending: dict = {}
+
+    def counters(self) -> tuple[int, int, int, int]:
+        return self.total, self.idx, self.successful, self.failed
+
+    def count(self, result: bool | None) -> None:
+        self.idx += 1
+        if result is None:
+            return
+        if result:
+            self.successful += 1
+        else:
+            self.failed += 1
+
+    def add(self, position) -> bool:
+        """Take a listing position, True when its detail page must be fetched"""
+        if self.streaming:
+            self.total += 1
+        # Listing-sufficient positions skip the detail page
+        details = self.scraper._listing_job(position)
+        if details is None:
+            return True
+        self.listing_batch.append((position, details))
+        return False
+
+    def listing_full(self) -> bool:
+        return len(self.listing_batch) >= self.scraper.listing_batch_size
+
+    def save_listing(self) -> None:
+        batch, self.listing_batch = self.listing_batch, []
+        if not batch:
+            return
+        for result in self.scraper._save_listing_jobs(batch):
+            self.count(result)
+
+    def collect(self, done) -> None:
+        for fetch in done:
+            self.count(self.scraper._collect(fetch, self.pending.pop(fetch)))
 
 
 class BaseScraper(Database):
+    # Number of detail pages fetched and parsed in parallel by main().
+    # Subclasses can override it; 1 keeps the old sequential behaviour.
+    workers: int = SCRAPER_WORKERS
+    # Extra options for the pooled HTTP client (max_connections, timeout, http2...)
+    http_options: dict = {}
+    # (requests per second, burst) allowed on the scraper's own host, None = unlimited
+    rate_limit: tuple[float, int] | None = None
+    # Progress writes are coalesced, see _progress()
+    progress_interval = PROGRESS_INTERVAL
+    progress_every = PROGRESS_EVERY
+    # Listing-sufficient scrapers: job fields given by the listing, see job_from_listing()
+    listing_fields: frozenset[str] = frozenset()
+    # A listing job missing one of these goes through get_position_details() instead
+    critical_fields: frozenset[str] = frozenset({"jobposition", "jobdescription", "scrapedsource"})
+    # Listing jobs validated together by validate_many()
+    listing_batch_size = 256
+
     def __init__(self, save: bool, name: str, link: str, process_id: int, companyid: int, domain: str = "", is_test: bool = False) -> None:
         super().__init__()
         self.name = name
@@ -16,14 +105,43 @@ class BaseScraper(Database):
         self.companyid = companyid
         self.save = save
         self.is_test = is_test
-        self.process_id = process_id
-        self.create_db_and_tables()
+        # Stored with the progress so app.py can stop the right process
+        self.process_id = process_id or os.getpid()
+        # Incremental mode skips the positions scraped less than refresh_days ago
+        self.incremental = INCREMENTAL
+        self.refresh_days = INCREMENTAL_REFRESH_DAYS
+        self._known_positions: dict[str, float] = {}
+        # jobid -> position key of the jobs sent this run, kept once they are committed
+        self._scraped_keys: dict[int, str] = {}
+        # Listing diff: only added or changed cards are fetched, see _diff_listing()
+        self.listing_diff = LISTING_DIFF
+        self._snapshot: dict[str, tuple[str, int | None]] = {}
+        self._seen_positions: set[str] = set()
+        self._snapshot_rows: list[tuple[str, str, int | None]] = []
+        self._diff_counts: Counter = Counter()
+        # Listing pages that could not be read, see _page_failed()
+        self._failed_pages = 0
+        # (time, current) of the last progress written
+        self._last_progress = (0.0, 0)
+        self.client = self._create_client()
+        # For sessions that do not go through self.client (cloudscraper)
+        self.retry_policy = RetryPolicy()
+        if self.rate_limit:
+            for url in (link, domain):
+                rate_limiter.configure(urlparse(url).netloc, *self.rate_limit)
 
 
-    @staticmethod
-    def get_html(url: str) -> str:
+    def _http_options(self) -> dict:
+        # Keep at least one idle connection per worker so they are all reused
+        return {"max_keepalive": max(HTTP_MAX_KEEPALIVE, self.workers), **self.http_options}
+
+    def _create_client(self) -> httpx.Client:
+        return create_client(**self._http_options())
+
+
+    def get_html(self, url: str) -> str:
         """Extract the html from a url"""
-        response = httpx.get(url)
+        response = self.client.get(url)
         print(response)
         print(response.url)
         response.raise_for_status()
@@ -32,24 +150,50 @@ class BaseScraper(Database):
 
     def validate_data(self, job_details: dict):
         """Validate Scraped job info"""
-        scraped_job = jobs(**job_details)
+        scraped_job = self._prepare_job(job_details)
+        qualifications, experience = enrich_text(self._enrichment_task(scraped_job))
+        return self._complete_job(scraped_job, qualifications, experience)
 
-        # Job qualification
-        if not scraped_job.jobqualifications:
-            scraped_job.jobqualifications = self._extract_qualifications(scraped_job.jobdescription)
+    def validate_many(self, job_details: Iterable[dict], batch_size: int = 512) -> Iterator[jobs]:
+        """Validate many jobs at once, same result as validate_data() on each of them.
 
+        The qualification and experience extraction of a batch runs in the
+        shared process pool (see src.utils.enrichment). job_details can be a
+        generator, it is consumed batch_size jobs at a time.
+        """
+        batch = []
+        for details in job_details:
+            batch.append(self._prepare_job(details))
+            if len(batch) >= batch_size:
+                yield from self._validate_batch(batch)
+                batch = []
+        if batch:
+            yield from self._validate_batch(batch)
 
-        # Job exprience
-        if not scraped_job.jobexperience:
-            scraped_job.jobexperience = "General"
-            years = self._extract_years_from_text(scraped_job.jobdescription)
-            if years:
-                if years[0] > 20:
-                    scraped_job.jobexperience = "Highly Experienced"
-                else:
-                    scraped_job.jobexperience = f"{years[0]}-years"
+    def _validate_batch(self, batch: list[jobs]) -> Iterator[jobs]:
+        results = enrich_many([self._enrichment_task(scraped_job) for scraped_job in batch])
+        for scraped_job, (qualifications, experience) in zip(batch, results):
+            yield self._complete_job(scraped_job, qualifications, experience)
+
+    def _prepare_job(self, job_details: dict) -> jobs:
+        job_details = dict(job_details)
+        # Scrapers may give the native requisition id, never a timestamp
+        native_id = job_details.pop("jobid", None)
+        scraped_job = jobs(**job_details)
+        scraped_job.jobid = make_jobid(scraped_job.companyid, str(native_id or canonical_source(scraped_job.scrapedsource)))
+        return scraped_job
+
+    @staticmethod
+    def _enrichment_task(scraped_job: jobs) -> tuple[str, bool, bool]:
+        return scraped_job.jobdescription, not scraped_job.jobqualifications, not scraped_job.jobexperience
+
+    def _complete_job(self, scraped_job: jobs, qualifications: str | None, experience: str | None) -> jobs:
+        # Job qualification and exprience, extracted from the description when missing
+        if qualifications is not None:
+            scraped_job.jobqualifications = qualifications
+        if experience is not None:
+            scraped_job.jobexperience = experience
 
-                    
         # Job pattern
         if not scraped_job.jobpattern:
             for pattern in static.workPatterns:
@@ -59,6 +203,13 @@ class BaseScraper(Database):
                 else:
                     scraped_job.jobpattern = "full-time"
 
+        # Job country, resolved offline from the address ("Charlotte, NC" -> United States)
+        # when the scraper gave none or one the gazetteer does not know
+        if scraped_job.jobaddress and (not scraped_job.jobcountry or not normalize_location(scraped_job.jobcountry).country):
+            location = normalize_location(", ".join(filter(None, [scraped_job.jobaddress, scraped_job.jobcountry])))
+            if location.country:
+                scraped_job.jobcountry = location.country
+
         if (not scraped_job.jobcountry) and (scraped_job.jobaddress):
             scraped_job.jobcountry = "Same As Address"
         if (not scraped_job.jobaddress) and (scraped_job.jobcountry):
@@ -80,111 +231,34 @@ class BaseScraper(Database):
 
         scraped_job.jobsalary = scraped_job.jobsalary.replace("Salary:", "")
 
+        scraped_job.jobfingerprint = job_fingerprint(scraped_job)
         return scraped_job
 
     def _normalize_text(self, text: str) -> str:
         """Normalise les caractères typographiques (apostrophes, tirets)"""
-        if not text:
-            return ""
-        return text.replace("'", "'").replace("'", "'").replace("–", "-").replace("—", "-").strip()
+        return normalize_text(text)
 
 
     def _extract_years_from_text(self, text: str) -> list[int]:
         """
         Extrait toutes les années d'expérience mentionnées dans le texte.
         """
-        years_found = []
-        
-        # Pattern pour "X or more years"
-        pattern_or_more = r"(\d+)\s+or\s+more\s+years?"
-        for match in re.finditer(pattern_or_more, text):
-            years_found.append(int(match.group(1)))
-        
-        # Pattern pour "X years", "X+ years", "X-Y years"
-        pattern_standard = r"(\d+)(?:\s*[-–—]\s*(\d+))?(?:\+)?\s+years?"
-        for match in re.finditer(pattern_standard, text):
-            match_text = match.group(0)
-            # Éviter les doublons avec "or more"
-            if "or more" not in match_text:
-                first_year = int(match.group(1))
-                second_year = int(match.group(2)) if match.group(2) else None
-                years_found.append(max(first_year, second_year) if second_year else first_year)
-        
-        return years_found
+        return extract_years(text)
 
 
     def _extract_qualifications(self, jobdescription: str) -> str:
         """
         Extrait les qualifications requises depuis la description du poste.
-        
-        Recherche d'abord directement dans static.qualifications, puis utilise des mappings
-        personnalisés pour les valeurs qui ne sont pas dans la liste.
+
+        Voir src.utils.qualifications: static.qualifications d'abord, puis les
+        mappings personnalisés, en une seule passe sur le texte.
         """
-        if not jobdescription:
-            return "General"
-        
-        # 1. Normalisation importante (apostrophes courbes vs droites)
-        desc_normalized = self._normalize_text(jobdescription).lower()
-        
-        # 2. Recherche d'abord dans static.qualifications
-        for qualification in static.qualifications:
-            qual_lower = self._normalize_text(qualification).lower()
-            if qual_lower in desc_normalized:
-                return qualification
-            
-            # Recherche flexible sur la partie principale
-            main_part = qual_lower.split("(")[0].strip()
-            # Nettoyage supplémentaire pour "Bachelor's" -> "bachelor
-            main_keyword = main_part.replace("'s", "").replace("'s", "").strip()
-            
-            if len(main_keyword) > 3 and f" {main_keyword} " in f" {desc_normalized} ":
-                return qualification
-        
-        # 3. Mappings personnalisés simplifiés (seulement High School, Associate, Bachelor)
-        custom_mappings = [
-            # High School variations
-            ("high school diploma", "High School (S.S.C.E)"),
-            ("high school diploma or ged", "High School (S.S.C.E)"),
-            ("high school diploma or g.e.d", "High School (S.S.C.E)"),
-            ("ged", "High School (S.S.C.E)"),
-            ("g.e.d", "High School (S.S.C.E)"),
-            ("secondary school", "High School (S.S.C.E)"),
-            ("high school certificate", "High School (S.S.C.E)"),
-            ("ssce", "High School (S.S.C.E)"),
-            
-            # Associate variations
-            ("associate degree", "Associate"),
-            ("associates degree", "Associate"),
-            ("associate's", "Associate"),
-            ("associate", "Associate"),
-            
-            # Bachelor variations
-            ("bachelor's", "Bachelor's (B.A.)"), 
-            ("bachelors", "Bachelor's (B.A.)"),
-            ("bachelor's degree", "Bachelor's (B.A.)"),
-            ("bachelor degree", "Bachelor's (B.A.)"),
-            ("bachelor of arts", "Bachelor's (B.A.)"),
-            ("bachelor of science", "Bachelor's (B.Sc.)"),
-            ("bachelor of commerce", "Bachelor's (B.Com.)"),
-            ("bachelor of engineering", "Bachelor's (B.Eng.)"),
-            ("bachelor of education", "Bachelor's (B.Ed.)"),
-            ("bachelor of laws", "Bachelor's (LLB)"),
-            ("bachelor of laws", "Bachelor's (LLB)"),
-        ]
-        
-        for keyword, qualification in custom_mappings:
-            if keyword in desc_normalized:
-                # Vérifier que la qualification existe dans static.qualifications
-                if qualification in static.qualifications:
-                    return qualification
-        
-        return "General"
-        
-    
+        return extract_qualification(jobdescription)
+
 
     @abstractmethod
-    def get_positions(self) -> list[str]:
-        """Extract the position links"""
+    def get_positions(self) -> Iterable[str]:
+        """Extract the position links (a list or a generator)"""
         pass
 
     @abstractmethod
@@ -194,65 +268,300 @@ class BaseScraper(Database):
         pass
 
 
-    def main(self) -> None:
-        print(self.name) 
-        successful = 0
-        failed = 0
-        idx = 0
-        status = "running"
-        total = 0
+    def job_from_listing(self, position) -> dict | None:
+        """Job built from the listing entry alone (same keys as get_position_details),
+        for scrapers declaring listing_fields. None when the detail page is needed."""
+        return None
+
+    def _listing_job(self, position) -> dict | None:
+        if not self.listing_fields or not self.critical_fields <= self.listing_fields:
+            return None
+        details = self.job_from_listing(position)
+        if details is None or not all(details.get(field) for field in self.critical_fields):
+            return None
+        return details
+
+    def _save_listing_jobs(self, batch: list[tuple[object, dict]]) -> list[bool | None]:
+        """Validate listing jobs in one validate_many() call and save them, a result per job"""
+        try:
+            validated = list(self.validate_many([details for _, details in batch]))
+        except Exception as e:
+            print(f"ERROR - {str(e)}")
+            return [False] * len(batch)
+        return [self._save_position(job, position) for (position, _), job in zip(batch, validated)]
+
+    def position_key(self, position) -> str:
+        """Stable identifier of a listing entry, used by the incremental index.
+
+        It must be the scrapedsource of the job: the index is seeded with the
+        sources already stored, see _load_known_positions()."""
+        if isinstance(position, str):
+            return position
+        return json.dumps(position, sort_keys=True, default=str)
+
+    def _load_known_positions(self) -> None:
+        self._known_positions = self.get_scraped_positions(self.name)
+        if not self.save:
+            return
 
-        self._update_progress({
+        # First incremental run: seed the index with the jobs already stored
+        try:
+            sources = self.get_known_sources(self.companyid)
+        except Exception as e:
+            print(f"Could not load the stored jobs: {e}")
+            return
+        now = time.time()
+        new_sources = [source for source in sources if source not in self._known_positions]
+        self._known_positions.update(dict.fromkeys(new_sources, now))
+        self.mark_positions_scraped(self.name, new_sources, now)
+
+    def _is_fresh(self, position) -> bool:
+        scraped = self._known_positions.get(self.position_key(position))
+        return scraped is not None and time.time() - scraped < self.refresh_days * 86400
+
+    async def _skip_known_async(self, positions: AsyncIterable) -> AsyncIterable:
+        async for position in positions:
+            if not self._is_fresh(position):
+                yield position
+
+    def _skip_known(self, positions):
+        """Incremental mode: drop the positions scraped within the refresh window"""
+        if not self.incremental:
+            return positions
+
+        self._load_known_positions()
+        print(f"INCREMENTAL - {len(self._known_positions)} known positions")
+        if isinstance(positions, Sized):
+            return [position for position in positions if not self._is_fresh(position)]
+        if isinstance(positions, AsyncIterable):
+            return self._skip_known_async(positions)
+        return (position for position in positions if not self._is_fresh(position))
+
+    def listing_card(self, position):
+        """What the listing shows of a position (title, location, date...).
+
+        A position that is only a link has no card: its URL does not change
+        when the posting is edited. Scrapers reading a richer listing than
+        the links they yield override this."""
+        return None if isinstance(position, str) else position
+
+    def card_hash(self, position) -> str | None:
+        """Hash of the listing card, it changes when the posting is edited. None without a card"""
+        card = self.listing_card(position)
+        if card is None:
+            return None
+        return blake2b(json.dumps(card, sort_keys=True, default=str).encode(), digest_size=8).hexdigest()
+
+    def _is_unchanged(self, position) -> bool:
+        key = self.position_key(position)
+        self._seen_positions.add(key)
+        previous = self._snapshot.get(key)
+        if previous is None:
+            self._diff_counts["added"] += 1
+            return False
+        card_hash = self.card_hash(position)
+        if card_hash is None:
+            # Still tracked so the posting can be closed, but never skipped
+            self._diff_counts["no card"] += 1
+            return False
+        if previous[0] != card_hash:
+            self._diff_counts["changed"] += 1
+            return False
+        self._diff_counts["unchanged"] += 1
+        return True
+
+    async def _diff_listing_async(self, positions: AsyncIterable) -> AsyncIterable:
+        async for position in positions:
+            if not self._is_unchanged(position):
+                yield position
+
+    def _diff_listing(self, positions):
+        """Listing diff: drop the cards identical to the last run's snapshot"""
+        if not self.listing_diff:
+            return positions
+
+        self._snapshot = self.get_listing_snapshot(self.name)
+        print(f"LISTING DIFF - {len(self._snapshot)} cards in the last snapshot")
+        if isinstance(positions, Sized):
+            return [position for position in positions if not self._is_unchanged(position)]
+        if isinstance(positions, AsyncIterable):
+            return self._diff_listing_async(positions)
+        return (position for position in positions if not self._is_unchanged(position))
+
+    def _page_failed(self, page, error) -> None:
+        """Report a listing page that could not be read: the listing is then
+        incomplete and no posting is closed by the listing diff"""
+        self._failed_pages += 1
+        print(f"PAGE {page} failed: {error}")
+
+    def _save_snapshot(self, status: str) -> None:
+        """Store the new cards and close the postings gone from a fully read listing"""
+        if not self.listing_diff or not self.save:
+            return
+        if self._failed_pages:
+            print(f"LISTING DIFF - {self._failed_pages} listing pages failed, no job closed")
+        # An interrupted or partial listing was not fully seen, nothing can be called removed
+        removed = [] if status != "completed" or self.is_test or self._failed_pages else [
+            position for position in self._snapshot if position not in self._seen_positions
+        ]
+        self._diff_counts["removed"] = len(removed)
+        print(f"LISTING DIFF - {dict(self._diff_counts)}")
+        try:
+            if self._snapshot_rows:
+                self.save_listing_snapshot(self.name, self._snapshot_rows)
+                # Postings back in the listing are open again
+                added = [jobid for position, _, jobid in self._snapshot_rows if position not in self._snapshot]
+                if added:
+                    self.set_jobs_status(added, "scraped", only_if="closed")
+                self._snapshot_rows = []
+
+            if removed:
+                jobids = [self._snapshot[position][1] for position in removed if self._snapshot[position][1] is not None]
+                closed = self.set_jobs_status(jobids, "closed") if jobids else 0
+                self.delete_listing_snapshot(self.name, removed)
+                print(f"LISTING DIFF - {closed} jobs closed")
+        except Exception as e:
+            print(f"Could not save the listing snapshot: {str(e)}")
+
+    def _drain_jobs(self, status: str, run: _RunState) -> str:
+        """Write the buffered jobs and move the ones the database dropped from
+        the successful to the failed count. The run fails when none was stored."""
+        if not self.save:
+            return status
+        try:
+            committed, failed = self.flush_jobs()
+        except Exception as e:
+            print(f"\n❌ Could not save the buffered jobs: {str(e)}")
+            committed, failed = set(), set(self._scraped_keys)
+        lost = [jobid for jobid in failed if jobid in self._scraped_keys]
+        if not lost:
+            return status
+        print(f"\n❌ {len(lost)} jobs could not be saved")
+        # Scrape these positions again next time
+        for jobid in lost:
+            del self._scraped_keys[jobid]
+        self._snapshot_rows = [row for row in self._snapshot_rows if row[2] not in failed]
+        run.successful -= len(lost)
+        run.failed += len(lost)
+        return status if committed else "failed"
+
+    def _save_scraped_keys(self) -> None:
+        """Record the positions of this run, called once _drain_jobs() wrote their jobs"""
+        # Nothing was stored by a dry or test run, it must not hide positions from the next one
+        if not self.save or self.is_test:
+            self._scraped_keys = {}
+            return
+        if self._scraped_keys:
+            self.mark_positions_scraped(self.name, list(self._scraped_keys.values()), time.time())
+            self._scraped_keys = {}
+
+
+    def _fetch_position(self, position) -> jobs:
+        """Fetch and validate a single position (runs inside a worker thread)"""
+        job_details = self.get_position_details(position)
+        return self.validate_data(job_details)
+
+    def _handle_result(self, parsed_position: jobs) -> bool:
+        """Save a validated position, returns False when it must be ignored"""
+        print(parsed_position)
+
+        if not parsed_position.jobposition:
+            return False
+
+        if self.save:
+            self.send_job(parsed_position)
+
+        return True
+
+    def _save_position(self, parsed_position: jobs, position) -> bool | None:
+        if not self._handle_result(parsed_position):
+            return None
+        self._scraped_keys[parsed_position.jobid] = self.position_key(position)
+        if self.listing_diff:
+            self._snapshot_rows.append((self.position_key(position), self.card_hash(position) or "", parsed_position.jobid))
+        return True
+
+    def _collect(self, future, position) -> bool | None:
+        """Handle a finished position: True if saved, False if failed, None if ignored"""
+        try:
+            return self._save_position(future.result(), position)
+        except Exception as e:
+            print(f"ERROR - {str(e)}")
+            return False
+
+    def _progress_update(self, total: int, current: int, successful: int, failed: int, status: str) -> dict | None:
+        """Progress to write now, None when it is coalesced with a later one"""
+        now = time.monotonic()
+        written_at, written_current = self._last_progress
+        if (
+            status == "running"
+            and current > 0
+            and now - written_at < self.progress_interval
+            and current - written_current < self.progress_every
+        ):
+            return None
+        self._last_progress = (now, current)
+
+        return {
             "site": self.name,
             "total": total,
-            "current": 0,
-            "successful": 0,
-            "failed": 0,
+            "current": current,
+            "successful": successful,
+            "failed": failed,
             "status": status,
             "last_updated": datetime.now().isoformat()
-        }) 
-        
+        }
+
+    def _progress(self, total: int, current: int, successful: int, failed: int, status: str) -> None:
+        """Record progress, running updates are only written every progress_interval
+        seconds or progress_every jobs. The first and the final ones are always written."""
+        data = self._progress_update(total, current, successful, failed, status)
+        if data is not None:
+            self._update_progress(data)
+
+
+    def main(self) -> None:
+        print(self.name) 
+        status = "running"
+        run = _RunState(self)
+
+        self._progress(*run.counters(), status)
+
         try:
-            positions = self.get_positions()
-            total = len(positions)  
-            self._update_progress({
-                "site": self.name,
-                "total": total,
-                "current": 0,
-                "successful": 0,
-                "failed": 0,
-                "status": "running",
-                "last_updated": datetime.now().isoformat()
-            })
-            
-            for idx, position in enumerate(positions, 1):
-                try:
-                    job_details = self.get_position_details(position)
-                    parsed_position = self.validate_data(job_details)
-                    print(parsed_position)
-                    
-                    if not parsed_position.jobposition:
-                        continue
-                        
-                    if self.save:
-                        self.send_job(parsed_position)
-                    
-                    successful += 1
-                    
-                except Exception as e:
-                    print(f"ERROR - {str(e)}")
-                    failed += 1
-                
-                self._update_progress({
-                    "site": self.name,
-                    "total": total,
-                    "current": idx,
-                    "successful": successful,
-                    "failed": failed,
-                    "status": "running",
-                    "last_updated": datetime.now().isoformat()
-                })
-            
+            positions = self._skip_known(self._diff_listing(self.get_positions()))
+            # Generators are consumed while the detail pages are fetched,
+            # the total then grows with the listing
+            run.streaming = not isinstance(positions, Sized)
+            run.total = 0 if run.streaming else len(positions)
+            self._progress(run.total, 0, 0, 0, "running")
+
+            executor = ThreadPoolExecutor(max_workers=max(1, self.workers))
+            window = max(1, self.workers) * 2
+
+            def collect() -> None:
+                done, _ = wait(run.pending, return_when=FIRST_COMPLETED)
+                run.collect(done)
+                self._progress(*run.counters(), "running")
+
+            try:
+                # Results are consumed in the main thread so the counters,
+                # send_job and _update_progress are never touched concurrently
+                for position in positions:
+                    if run.add(position):
+                        run.pending[executor.submit(self._fetch_position, position)] = position
+                    elif run.listing_full():
+                        run.save_listing()
+                        self._progress(*run.counters(), "running")
+                    while len(run.pending) >= window:
+                        collect()
+
+                run.save_listing()
+                while run.pending:
+                    collect()
+            finally:
+                # Do not wait for queued pages when interrupted
+                executor.shutdown(wait=False, cancel_futures=True)
+
             status = "completed"
             
         except KeyboardInterrupt:
@@ -266,16 +575,12 @@ class BaseScraper(Database):
             raise
             
         finally:
+            self.client.close()
+            status = self._drain_jobs(status, run)
+            self._save_scraped_keys()
+            self._save_snapshot(status)
             # ALWAYS saves progress, even if something crashes
-            self._update_progress({
-                "site": self.name,
-                "total": total,
-                "current": idx,
-                "successful": successful,
-                "failed": failed,
-                "status": status,
-                "last_updated": datetime.now().isoformat()
-            })  
+            self._progress(*run.counters(), status)
 
     def _update_progress(self, data: dict) -> None:
         """Update progress in database with current site's data"""
@@ -291,6 +596,7 @@ class BaseScraper(Database):
             failed=data['failed'],
             status=data['status'],
             last_updated=data['last_updated'],
+            process_id=self.process_id,
         )
         
         # Update or insert in database
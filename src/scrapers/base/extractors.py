@@ -0,0 +1,92 @@
+import json
+from functools import lru_cache
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+JSON_LD_TYPE = "application/ld+json"
+PHENOM_DDO = "phApp.ddo"
+# Pages are large, only the last few are kept (a listing and the detail pages in flight)
+CACHE_SIZE = 32
+
+_decoder = json.JSONDecoder()
+
+
+def loads(payload: str):
+    """json.loads, with orjson when it is installed"""
+    if orjson is not None:
+        return orjson.loads(payload)
+    return json.loads(payload)
+
+
+def _json_ld_payloads(html: str):
+    """Raw text of every <script type="application/ld+json"> of the page, in order"""
+    index = html.find(JSON_LD_TYPE)
+    while index != -1:
+        tag_start = html.rfind("<", 0, index)
+        start = html.find(">", index) + 1
+        end = html.find("</script>", start)
+        if not start or end == -1:
+            return
+        if html.startswith("<script", tag_start):
+            yield html[start:end]
+        index = html.find(JSON_LD_TYPE, end)
+
+
+def _json_ld_objects(data):
+    # A block can be one object, a list of objects or a {"@graph": [...]}
+    if isinstance(data, list):
+        for item in data:
+            yield from _json_ld_objects(item)
+    elif isinstance(data, dict):
+        if "@graph" in data:
+            yield from _json_ld_objects(data["@graph"])
+        else:
+            yield data
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def extract_json_ld(html: str, schema_type: str = "JobPosting") -> dict | None:
+    """First JSON-LD object of type schema_type, else the first one of the page.
+
+    The page is scanned with str.find only, no DOM is built. Results are cached
+    per page and shared, they must not be modified.
+    """
+    first = None
+    for payload in _json_ld_payloads(html):
+        try:
+            data = loads(payload)
+        except ValueError:
+            continue
+        for item in _json_ld_objects(data):
+            types = item.get("@type", "")
+            if schema_type == types or (isinstance(types, list) and schema_type in types):
+                return item
+            if first is None:
+                first = item
+    return first
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def extract_phenom_ddo(html: str) -> dict | None:
+    """The phApp.ddo object of a Phenom page (listing and job pages), None when missing.
+
+    Decoding starts at the opening brace and stops at the matching one, the rest
+    of the script is never read. Cached per page, must not be modified.
+    """
+    index = html.find(PHENOM_DDO)
+    while index != -1:
+        equal = html.find("=", index + len(PHENOM_DDO))
+        start = html.find("{", equal)
+        # "phApp.ddo = {" only, not "phApp.ddo.x" or a mention in a comment
+        if equal != -1 and start != -1 and not html[index + len(PHENOM_DDO):start].strip(" \t\r\n="):
+            try:
+                data, _ = _decoder.raw_decode(html, start)
+                return data
+            except ValueError:
+                pass
+        index = html.find(PHENOM_DDO, index + len(PHENOM_DDO))
+    return None
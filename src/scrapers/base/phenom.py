@@ -0,0 +1,112 @@
+import html
+from collections.abc import AsyncIterator
+from urllib.parse import urlparse
+from selectolax.parser import HTMLParser
+from src.scrapers.base.async_base_scraper import AsyncBaseScraper
+from src.scrapers.base.extractors import extract_json_ld, extract_phenom_ddo
+
+
+class PhenomScraper(AsyncBaseScraper):
+    """Career sites hosted by Phenom (".../global/en/search-results").
+
+    The search page embeds its results in phApp.ddo: the first page gives
+    totalHits, the other offsets are then fetched concurrently. Each listing
+    card is kept as the position, so only the description comes from the
+    job page. A new Phenom tenant only needs a name, a link and a company id.
+    """
+    # Asked for, the tenant may send less: the real page size is read from the first page
+    page_size = 50
+    # Text from which the description is cut ("Why Cisco?" boilerplate)
+    description_end = ""
+
+    def __init__(self, save: bool, name: str, link: str, companyid: int, process_id: int = 0, is_test: bool = False) -> None:
+        parsed_url = urlparse(link)
+        super().__init__(
+            name=name,
+            link=link,
+            domain=f"{parsed_url.scheme}://{parsed_url.netloc}",
+            companyid=companyid,
+            save=save,
+            process_id=process_id,
+            is_test=is_test,
+        )
+        # ".../global/en/search-results" -> ".../global/en/job/<jobSeqNo>"
+        self.job_link = f"{link.rsplit('/', 1)[0]}/job"
+
+    async def _search_page(self, offset: int) -> tuple[list[dict], int]:
+        """(jobs, totalHits) of the search page starting at offset"""
+        page = await self.get_html(f"{self.link}?from={offset}&s=1&size={self.page_size}")
+        search = (extract_phenom_ddo(page) or {}).get("eagerLoadRefineSearch") or {}
+        return (search.get("data") or {}).get("jobs") or [], search.get("totalHits") or 0
+
+    async def get_positions(self) -> AsyncIterator[dict]:
+        jobs, total = await self._search_page(0)
+        print(f"TOTAL HITS - {total} | PAGE SIZE - {len(jobs)}")
+        seen = set()
+
+        def new_jobs(page: list[dict]):
+            for job in page:
+                if job.get("jobSeqNo") and job["jobSeqNo"] not in seen:
+                    seen.add(job["jobSeqNo"])
+                    yield job
+
+        for job in new_jobs(jobs):
+            yield job
+        if not jobs or self.is_test:
+            return
+
+        async def fetch(offset: int) -> list[dict]:
+            page, _ = await self._search_page(offset)
+            return page
+
+        async for page in self._fetch_pages(fetch, range(len(jobs), total, len(jobs))):
+            for job in new_jobs(page):
+                yield job
+        print(f"ALL JOBS - {len(seen)}")
+
+    def position_key(self, job: dict) -> str:
+        return f"{self.job_link}/{job['jobSeqNo']}"
+
+    def _description(self, description_html: str) -> str:
+        # JSON-LD descriptions are often escaped twice ("&lt;p&gt;")
+        if "&lt;" in description_html:
+            description_html = html.unescape(description_html)
+        text = HTMLParser(description_html).text(separator=" ") if description_html else ""
+        text = " ".join(text.split())
+        if self.description_end and self.description_end in text:
+            text = text.split(self.description_end)[0].strip()
+        return text
+
+    @staticmethod
+    def _pattern(employment_type) -> str:
+        if isinstance(employment_type, list):
+            employment_type = employment_type[0] if employment_type else ""
+        employment_type = str(employment_type or "").lower().replace("_", " ")
+        if "part" in employment_type:
+            return "part-time"
+        if "full" in employment_type:
+            return "full-time"
+        return ""
+
+    async def get_position_details(self, job: dict) -> dict:
+        position_link = self.position_key(job)
+        page = await self.get_html(position_link)
+
+        # Description from the job page, everything else from the listing card when present
+        detail = (((extract_phenom_ddo(page) or {}).get("jobDetail") or {}).get("data") or {}).get("job") or {}
+        json_ld = extract_json_ld(page) or {}
+        identifier = json_ld.get("identifier")
+
+        jobaddress = job.get("location") or ", ".join(filter(None, [job.get("city"), job.get("state")]))
+        job_dict = {
+            "jobid": (identifier.get("value") if isinstance(identifier, dict) else "") or detail.get("jobId") or job.get("jobId") or "",
+            "companyid": self.companyid,
+            "jobposition": job.get("title") or detail.get("title") or json_ld.get("title", ""),
+            "jobdescription": self._description(detail.get("description") or json_ld.get("description", "")),
+            "jobpattern": self._pattern(job.get("type") or json_ld.get("employmentType")),
+            "jobcountry": job.get("country") or detail.get("country") or "",
+            "jobaddress": jobaddress or detail.get("location") or "",
+            "jobniche": job.get("department") or job.get("category") or "",
+            "scrapedsource": position_link,
+        }
+        return job_dict
@@ -1,4 +1,3 @@
-from datetime import datetime
 from urllib.parse import urljoin
 
 from selectolax.parser import HTMLParser
@@ -51,7 +50,6 @@ class CapitecBank(BaseScraper):
         jobdescription = desc_el.text(strip=True, separator=" ") if desc_el else ""
 
         job_dict = {
-            "jobid": int(datetime.now().timestamp()),
             "companyid": self.companyid,
             "jobposition": jobposition,
             "jobdescription": jobdescription,
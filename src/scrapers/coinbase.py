@@ -1,15 +1,17 @@
 from src.scrapers.base.base_scraper import BaseScraper
-from selectolax.parser import HTMLParser
-from urllib.parse import urljoin
-from datetime import datetime
-import json
+from src.scrapers.base.extractors import extract_json_ld
+from urllib.parse import urljoin, urlparse
 import re
-import time
-import random
+import threading
 import cloudscraper
+from src.utils.rate_limiter import rate_limiter
+from src.utils.experience import extract_year_range
+from src.utils.http_cache import get_response_cache
 
 
 class Coinbase(BaseScraper):
+    rate_limit = (3, 1)
+
     def __init__(self, save: bool) -> None:
         super().__init__(
             name="Coinbase",
@@ -18,36 +20,47 @@ class Coinbase(BaseScraper):
             companyid=32,
             save=save
         )
-        self.scraper = cloudscraper.create_scraper(
-            browser={
-                'browser': 'chrome',
-                'platform': 'windows',
-                'mobile': False
-            },
-            delay=10
-        )
+        # cloudscraper sessions are not thread-safe, each detail worker gets its own
+        self._sessions = threading.local()
+
+    @property
+    def scraper(self) -> cloudscraper.CloudScraper:
+        """cloudscraper session of the calling thread"""
+        session = getattr(self._sessions, "session", None)
+        if session is None:
+            session = self._sessions.session = cloudscraper.create_scraper(
+                browser={
+                    'browser': 'chrome',
+                    'platform': 'windows',
+                    'mobile': False
+                },
+                delay=10
+            )
+        return session
 
     def get_html(self, url: str) -> str:
         """Extract the html from a url using cloudscraper.
 
-        Pour les tests locaux, délais minimaux pour démarrer rapidement.
+        La session cloudscraper ne passe pas par le client httpx, on attend donc
+        le rate limiter de l'hôte et on applique la politique de retry à la main.
         """
-        # Délai minimal pour les tests (0.1-0.5 secondes)
-        delay = random.uniform(0.1, 0.5)
-        time.sleep(delay)
-
         headers = {
             "Referer": "https://www.coinbase.com/careers/positions",
             "Sec-Fetch-Site": "same-origin",
         }
-        response = self.scraper.get(url, headers=headers)
 
-        # Gérer les erreurs 429
-        if response.status_code == 429:
-            print("⚠️ 429 détecté, attente de 5 secondes...")
-            time.sleep(5)
-            response = self.scraper.get(url, headers=headers)
+        def get():
+            rate_limiter.acquire(url)
+            return self.scraper.get(url, headers=headers)
+
+        def send(extra_headers: dict):
+            headers.update(extra_headers)
+            return self.retry_policy.run(get, urlparse(url).netloc)
 
+        cache = get_response_cache()
+        if cache:
+            return cache.get_text(url, send)
+        response = send({})
         response.raise_for_status()
         return response.text
 
@@ -60,6 +73,8 @@ class Coinbase(BaseScraper):
         max_pages = getattr(self, 'max_pages', None)
         while True:
             if max_pages and page > max_pages:
+                # The pages after the limit are not read, the listing is incomplete
+                self._page_failed(page, f"limit of {max_pages} pages reached")
                 break
                 
             url = f"{self.link}" if page == 1 else f"{self.link}?page={page}"
@@ -69,9 +84,10 @@ class Coinbase(BaseScraper):
                 html = self.get_html(url)
                 print(f"✅ Page {page} récupérée ({len(html)} caractères)")
             except Exception as e:
-                print(f"❌ Erreur page {page}: {e}")
                 if "429" in str(e) or "Too Many Requests" in str(e):
+                    self._page_failed(page, e)
                     break
+                print(f"❌ Erreur page {page}: {e}")
                 raise
             
             # Extraction directe avec regex sur le HTML brut (plus rapide)
@@ -115,24 +131,8 @@ class Coinbase(BaseScraper):
         if url_match:
             job_id = url_match.group(1)
 
-        # Extraire le JSON-LD directement avec regex 
-        json_ld = None
-        json_ld_match = re.search(r'<script[^>]*type=["\']application/ld\+json["\'][^>]*>(.*?)</script>', html, re.DOTALL)
-        if json_ld_match:
-            try:
-                json_ld = json.loads(json_ld_match.group(1))
-            except json.JSONDecodeError:
-                pass
-
-        # Si pas de JSON-LD, utiliser HTMLParser en fallback
-        if not json_ld:
-            soup = HTMLParser(html)
-            json_ld_script = soup.css_first('script[type="application/ld+json"]')
-            if json_ld_script:
-                try:
-                    json_ld = json.loads(json_ld_script.text())
-                except json.JSONDecodeError:
-                    pass
+        # JSON-LD lu directement dans la page, sans parser le DOM
+        json_ld = extract_json_ld(html)
 
         # Extraction des données depuis JSON-LD
         jobposition = json_ld.get("title", "") if json_ld else ""
@@ -152,11 +152,9 @@ class Coinbase(BaseScraper):
 
         # Experience : mapping "x-y years" -> "y years"
         jobexperience = ""
-        if jobdescription:
-            text_lower = jobdescription.lower()
-            range_match = re.search(r"(\d+)\s*-\s*(\d+)\s+years", text_lower)
-            if range_match:
-                jobexperience = f"{range_match.group(2)} years"
+        year_range = extract_year_range(jobdescription)
+        if year_range:
+            jobexperience = f"{year_range[1]} years"
 
         # Job Pattern
         jobpattern = ""
@@ -202,7 +200,7 @@ class Coinbase(BaseScraper):
                             jobcountry = parts[-1].strip()
  
         job_dict = {
-            "jobid": int(job_id) if job_id and job_id.isdigit() else int(datetime.now().timestamp()),
+            "jobid": job_id,
             "companyid": self.companyid,
             "jobposition": jobposition,
             "jobdescription": jobdescription,
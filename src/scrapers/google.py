@@ -1,5 +1,4 @@
 from urllib.parse import urljoin
-from datetime import datetime
 from selectolax.parser import HTMLParser
 from src.scrapers.base.base_scraper import BaseScraper
 
@@ -63,7 +62,6 @@ class Google(BaseScraper):
         country = location_el.text(strip=True) if location_el else ""
 
         job_dict = {
-            "jobid": int(datetime.now().timestamp()),
             "companyid": self.companyid,
             "jobposition": jobposition,
             "scrapedsource": position_link,
@@ -1,13 +1,16 @@
-from country_named_entity_recognition import find_countries
-from time import sleep, time
-
-import httpx
 from selectolax.parser import HTMLParser
 
-from src.scrapers.base.base_scraper import BaseScraper
+from src.scrapers.base.async_base_scraper import AsyncBaseScraper
+from src.utils.locations import location_resolver
+
 
+class Capgemini(AsyncBaseScraper):
+    # The listing API returns the whole job, no detail page is fetched
+    listing_fields = frozenset({
+        "jobposition", "jobdescription", "jobniche", "jobcountry", "jobaddress",
+        "jobqualifications", "jobexperience", "jobpattern", "scrapedsource",
+    })
 
-class Capgemini(BaseScraper):
     def __init__(self, save: bool) -> None:
         super().__init__(
             name="Capgemini",
@@ -18,8 +21,8 @@ class Capgemini(BaseScraper):
         )
 
 
-    def get_positions(self) -> list[str]:
-        response = httpx.get(f"{self.link}", timeout=60)
+    async def get_positions(self) -> list[str]:
+        response = await self.client.get(f"{self.link}", timeout=60)
         print(response)
         json_data = response.json()
 
@@ -28,19 +31,21 @@ class Capgemini(BaseScraper):
 
         return jobs
 
-    def get_position_details(self, job: dict) -> dict:
-        sleep(0.5)
+    def position_key(self, job: dict) -> str:
+        return job["apply_job_url"]
+
+    async def get_position_details(self, job: dict) -> dict:
+        return self.job_from_listing(job)
+
+    def job_from_listing(self, job: dict) -> dict:
         jobposition = job["title"]
         category = job["department"]
-        country = job["location"]
         location = job["location"]
 
-        country_finder = find_countries(location)
         jobcountry = ""
-        if country_finder:
-            country = country_finder[0][0].name
-            if location.endswith(country):
-                jobcountry = country
+        country = location_resolver.country(location)
+        if country and location.endswith(country):
+            jobcountry = country
 
 
 
@@ -50,7 +55,6 @@ class Capgemini(BaseScraper):
         jobexperience = job["experience_level"]
         jobpattern = job["contract_type"]
         job_dict = {
-            "jobid": int(time()),
             "companyid": self.companyid,
             "jobposition": jobposition,
             "jobdescription": job_description,
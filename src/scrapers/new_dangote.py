@@ -1,13 +1,13 @@
-from country_named_entity_recognition import find_countries
-from time import sleep, time
 from urllib.parse import urljoin
 
-import requests
 from selectolax.parser import HTMLParser
 from src.scrapers.base.base_scraper import BaseScraper
+from src.utils.locations import location_resolver
 
 
 class Dangote(BaseScraper):
+    rate_limit = (0.5, 1)
+
     def __init__(self) -> None:
         super().__init__(
             name="Dangote",
@@ -40,21 +40,18 @@ class Dangote(BaseScraper):
         return position_links
 
     def get_position_details(self, position_link: str) -> dict:
-        response = requests.get(position_link)
-        sleep(2)
+        response = self.client.get(position_link)
 
         soup = HTMLParser(response.text)
-        jobposition = response.url.split('/job/')[-1].split('/')[0].replace('-', " ").title()
+        jobposition = str(response.url).split('/job/')[-1].split('/')[0].replace('-', " ").title()
         category = soup.css_first('span[class="sc-crgk9f-7 fMHCZe"]')
         category = category.text(strip=True) if category else "" 
         location = soup.css_first('p[id="job-location"]')
         location = location.text(strip=True).replace("Location:", "") if location else ""
-        country_finder = find_countries(location)
         jobcountry = ""
-        if country_finder:
-            country = country_finder[0][0].name
-            if location.endswith(country):
-                jobcountry = country
+        country = location_resolver.country(location)
+        if country and location.endswith(country):
+            jobcountry = country
 
 
         job_description = soup.css_first('span[class="jobdescription"]')
@@ -66,7 +63,6 @@ class Dangote(BaseScraper):
         job_qualification = self._extract_qualifications(job_description)
 
         job_dict = {
-            "jobid": int(time()),
             "companyid": self.companyid,
             "jobposition": jobposition,
             "jobdescription": job_description,
@@ -1,11 +1,10 @@
-from time import sleep, time
-
-import requests
-
 from src.scrapers.base.base_scraper import BaseScraper
 
 
 class HUAWEI(BaseScraper):
+    # The listing API returns the whole job, no detail page is fetched
+    listing_fields = frozenset({"jobposition", "jobdescription", "jobcountry", "jobaddress", "jobniche", "jobpattern", "scrapedsource"})
+
     def __init__(self) -> None:
         super().__init__(
             name="HUAWEI",
@@ -15,16 +14,24 @@ class HUAWEI(BaseScraper):
         )
 
     def get_positions(self) -> list[str]:
-        response = requests.get(self.link)
+        response = self.client.get(self.link)
         json_data = response.json()
         jobs = json_data['result']
         print(f"ALL JOBS - {len(jobs)}")
 
         return jobs
 
+    @staticmethod
+    def _detail_url(position: dict) -> str:
+        return f"https://career.huawei.com/reccampportal/portal5/social-recruitment-detail.html?jobId={position['jobId']}&dataSource=1"
+
+    def position_key(self, position: dict) -> str:
+        return self._detail_url(position)
+
     def get_position_details(self, position: dict) -> dict:
-        sleep(2)
+        return self.job_from_listing(position)
 
+    def job_from_listing(self, position: dict) -> dict:
         jobposition = position["jobname"]
         country = position["jobArea"]
         location = country
@@ -32,7 +39,6 @@ class HUAWEI(BaseScraper):
         job_description = position["mainBusiness"]
         job_niche = position["deptName"]
         job_dict = {
-            "jobid": int(time()),
             "companyid": self.companyid,
             "jobposition": jobposition,
             "jobdescription": job_description,
@@ -40,7 +46,7 @@ class HUAWEI(BaseScraper):
             "jobaddress": location,
             "jobniche": job_niche,
             "jobpattern": jobtype,
-            "scrapedsource": f"https://career.huawei.com/reccampportal/portal5/social-recruitment-detail.html?jobId={position['jobId']}&dataSource=1",
+            "scrapedsource": self._detail_url(position),
             "parse_location": True
         }
         return job_dict
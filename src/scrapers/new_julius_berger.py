@@ -1,4 +1,3 @@
-from time import sleep, time
 from urllib.parse import urljoin
 
 from selectolax.parser import HTMLParser
@@ -7,6 +6,8 @@ from src.scrapers.base.base_scraper import BaseScraper
 
 
 class JB(BaseScraper):
+    rate_limit = (0.5, 1)
+
     def __init__(self) -> None:
         super().__init__(
             name="Julius Berger",
@@ -40,7 +41,6 @@ class JB(BaseScraper):
 
     def get_position_details(self, position_link: str) -> dict:
         html = self.get_html(position_link)
-        sleep(2)
 
         soup = HTMLParser(html)
         jobposition = soup.css_first('h1[class="sc-crgk9f-2 dYxSYU"]')
@@ -55,7 +55,6 @@ class JB(BaseScraper):
         job_description = job_description.text(strip=True) if job_description else ""
 
         job_dict = {
-            "jobid": int(time()),
             "companyid": self.companyid,
             "jobposition": jobposition,
             "jobdescription": job_description,
@@ -1,13 +1,13 @@
-from time import sleep, time
 from urllib.parse import urljoin
 
-import requests
 from selectolax.parser import HTMLParser
 
 from src.scrapers.base.base_scraper import BaseScraper
 
 
 class Sanofi(BaseScraper):
+    rate_limit = (0.5, 1)
+
     def __init__(self) -> None:
         super().__init__(
             name="Sanofi",
@@ -21,7 +21,7 @@ class Sanofi(BaseScraper):
         position_links = []
 
         while True:
-            response = requests.get(self.link.replace("?CurrentPage=3", f"?CurrentPage={page}"))
+            response = self.client.get(self.link.replace("?CurrentPage=3", f"?CurrentPage={page}"))
             json_data = response.json()
             soup = HTMLParser(json_data.get('results'))
 
@@ -48,7 +48,6 @@ class Sanofi(BaseScraper):
 
     def get_position_details(self, position_link: str) -> dict:
         html = self.get_html(position_link)
-        sleep(2)
 
         soup = HTMLParser(html)
         jobposition = soup.css_first('h1')
@@ -64,7 +63,6 @@ class Sanofi(BaseScraper):
         job_description = job_description.text(strip=True) if job_description else ""
 
         job_dict = {
-            "jobid": int(time()),
             "companyid": self.companyid,
             "jobposition": jobposition,
             "jobdescription": job_description,
@@ -6,6 +6,9 @@ from src.scrapers.base.base_scraper import BaseScraper
 
 
 class Siemens(BaseScraper):
+    # Petite limite pour ne pas surcharger le serveur
+    rate_limit = (2, 2)
+
     def __init__(self) -> None:
         super().__init__(
             name="Siemens",
@@ -54,11 +57,6 @@ class Siemens(BaseScraper):
 
             page += 1
 
-            # Petite pause pour ne pas surcharger le serveur
-            import time
-
-            time.sleep(0.5)
-
         return position_links
 
     def get_position_details(self, position_link: str) -> dict:
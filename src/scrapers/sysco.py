@@ -1,10 +1,9 @@
-from datetime import datetime
 from urllib.parse import urljoin
-import json
 
 from selectolax.parser import HTMLParser
 
 from src.scrapers.base.base_scraper import BaseScraper
+from src.scrapers.base.extractors import extract_json_ld
 
 
 class Sysco(BaseScraper):
@@ -39,8 +38,7 @@ class Sysco(BaseScraper):
         soup = HTMLParser(html)
 
         # Les détails sont disponibles en JSON-LD dans un script type application/ld+json
-        script = soup.css_first('script[type="application/ld+json"]')
-        data = json.loads(script.text()) if script else {}
+        data = extract_json_ld(html) or {}
 
         jobposition = data.get("title", "")
 
@@ -73,7 +71,6 @@ class Sysco(BaseScraper):
             jobcountry = address.get("addressCountry", "") or ""
 
         job_dict = {
-            "jobid": int(datetime.now().timestamp()),
             "jobposition": jobposition,
             "jobdescription": jobdescription,
             "jobpattern": jobpattern,
@@ -1,11 +1,13 @@
-from country_named_entity_recognition import find_countries
 from src.scrapers.base.base_scraper import BaseScraper
 from selectolax.parser import HTMLParser
-from urllib.parse import urljoin
-from datetime import datetime
+from urllib.parse import urljoin, urlparse
 import re
+import threading
 import cloudscraper
-from src.utils import static
+from src.utils.experience import extract_years
+from src.utils.http_cache import get_response_cache
+from src.utils.locations import location_resolver
+from src.utils.rate_limiter import rate_limiter
 
 
 class Verizon(BaseScraper):
@@ -16,22 +18,46 @@ class Verizon(BaseScraper):
             domain="https://mycareer.verizon.com",
             companyid=31
         )
-        self.scraper = cloudscraper.create_scraper(
-            browser={
-                'browser': 'chrome',
-                'platform': 'windows',
-                'mobile': False
-            },
-            delay=10
-        )
+        # cloudscraper sessions are not thread-safe, each detail worker gets its own
+        self._sessions = threading.local()
+
+    @property
+    def scraper(self) -> cloudscraper.CloudScraper:
+        """cloudscraper session of the calling thread"""
+        session = getattr(self._sessions, "session", None)
+        if session is None:
+            session = self._sessions.session = cloudscraper.create_scraper(
+                browser={
+                    'browser': 'chrome',
+                    'platform': 'windows',
+                    'mobile': False
+                },
+                delay=10
+            )
+        return session
 
     def get_html(self, url: str) -> str:
-        """Extract the html from a url using cloudscraper"""
+        """Extract the html from a url using cloudscraper.
+
+        The session does not go through the httpx client: the host rate
+        limiter is awaited here, on every attempt.
+        """
         headers = {
             "Referer": "https://mycareer.verizon.com/jobs/",
             "Sec-Fetch-Site": "same-origin",
         }
-        response = self.scraper.get(url, headers=headers)
+
+        def send(extra_headers: dict):
+            def get():
+                rate_limiter.acquire(url)
+                return self.scraper.get(url, headers={**headers, **extra_headers})
+
+            return self.retry_policy.run(get, urlparse(url).netloc)
+
+        cache = get_response_cache()
+        if cache:
+            return cache.get_text(url, send)
+        response = send({})
         response.raise_for_status()
         return response.text
 
@@ -46,7 +72,7 @@ class Verizon(BaseScraper):
             try:
                 html = self.get_html(url)
             except Exception as e:
-                print(f"Error getting page {page}: {e} -> Stopping pagination.", flush=True)
+                self._page_failed(page, f"{e} -> Stopping pagination.")
                 break
             soup = HTMLParser(html)
 
@@ -67,58 +93,37 @@ class Verizon(BaseScraper):
                         position_links.append(position_link)
 
             if page >= max_pages:
-                print(f"Reached limit of {max_pages} pages", flush=True)
+                # The pages after the limit are not read, the listing is incomplete
+                self._page_failed(page + 1, f"limit of {max_pages} pages reached")
                 break
             page += 1
 
         return position_links
 
-    def _text_to_digits(self, text: str) -> str:
-        """
-        Convertit les nombres écrits en lettres (one to ten, fifteen, twenty) en chiffres.
-        """
-        mapping = {
-            "one": "1", "two": "2", "three": "3", "four": "4", "five": "5",
-            "six": "6", "seven": "7", "eight": "8", "nine": "9", "ten": "10",
-            "eleven": "11", "twelve": "12", "thirteen": "13", "fourteen": "14",
-            "fifteen": "15", "sixteen": "16", "seventeen": "17", "eighteen": "18",
-            "nineteen": "19", "twenty": "20"
-        }
-        # On remplace les mots par des chiffres (ex: "Three" -> "3")
-        # Utilisation de \b pour les limites de mots afin d'éviter les remplacements partiels
-        for word, digit in mapping.items():
-            text = re.sub(r'\b' + word + r'\b', digit, text, flags=re.IGNORECASE)
-        return text
-
     def _extract_experience(self, jobdescription: str) -> str:
         """
         Extrait le niveau d'expérience requis depuis la description du job.
         """
         if not jobdescription:
             return "No Experience"
-        
-        # Normalisation et conversion des nombres en lettres
+
         desc_normalized = self._normalize_text(jobdescription).lower()
-        desc_normalized = self._text_to_digits(desc_normalized)
-        
-        # Vérification directe dans la liste statique
-        for experience in static.experienceLevels:
-            exp_normalized = self._normalize_text(experience).lower()
-            if exp_normalized in desc_normalized:
-                return experience
-        
-        # Extraction des années d'expérience via regex
-        years_found = self._extract_years_from_text(desc_normalized)
-        
+        if "no experience" in desc_normalized:
+            return "No Experience"
+
+        # Années d'expérience, en chiffres ou en lettres ("three to five years")
+        years_found = extract_years(desc_normalized)
         if years_found:
             # Filtrer les valeurs aberrantes et prendre le maximum
             valid_years = [y for y in years_found if 0 < y < 40]
             if not valid_years:
                 return "No Experience"
-            
-            final_years = max(valid_years)
-            return self._format_experience(final_years)
-        
+
+            return self._format_experience(max(valid_years))
+
+        if "highly experienced" in desc_normalized:
+            return "Highly Experienced"
+
         # Fallback: mappings textuels pour les cas sans chiffres explicites
         return self._extract_experience_from_keywords(desc_normalized)
     
@@ -206,13 +211,12 @@ class Verizon(BaseScraper):
         location_elem = soup.css_first(".locations")
         location_text = location_elem.text(strip=True) if location_elem else ""
         jobaddress = location_text
-        country_finder = find_countries(location_text)
-        if not country_finder:
+        jobcountry = ""
+        country = location_resolver.country(location_text)
+        if not country:
             jobcountry = "United States"
-        if country_finder:
-            country = country_finder[0][0].name
-            if location_text.endswith(country):
-                jobcountry = country
+        elif location_text.endswith(country):
+            jobcountry = country
 
         # Description (using .cms-content as requested)
         article = soup.css_first("article.cms-content")
@@ -251,7 +255,7 @@ class Verizon(BaseScraper):
             jobqualifications = self._extract_qualifications(jobdescription)
 
         job_dict = {
-            "jobid": int(job_id) if job_id and job_id.isdigit() else int(datetime.now().timestamp()),
+            "jobid": job_id,
             "companyid": self.companyid,
             "jobposition": jobposition,
             "jobdescription": jobdescription,
@@ -1,4 +1,3 @@
-from time import sleep, time
 from urllib.parse import urljoin
 
 from selectolax.parser import HTMLParser
@@ -7,6 +6,8 @@ from src.scrapers.base.base_scraper import BaseScraper
 
 
 class Wise(BaseScraper):
+    rate_limit = (0.5, 1)
+
     def __init__(self) -> None:
         super().__init__(
             name="Wise",
@@ -47,7 +48,6 @@ class Wise(BaseScraper):
 
     def get_position_details(self, position_link: str) -> dict:
         html = self.get_html(position_link)
-        sleep(2)
 
         soup = HTMLParser(html)
         jobposition = soup.css_first('span[class="header__text"]')
@@ -76,7 +76,6 @@ class Wise(BaseScraper):
         job_salary = job_salary.text(strip=True) if job_salary else ""
 
         job_dict = {
-            "jobid": int(time()),
             "companyid": self.companyid,
             "jobposition": jobposition,
             "jobdescription": job_description,
@@ -1,8 +1,6 @@
-from time import sleep
-import time
-import requests
+from collections.abc import AsyncIterator
 from selectolax.parser import HTMLParser
-from src.scrapers.base.base_scraper import BaseScraper
+from src.scrapers.base.async_base_scraper import AsyncBaseScraper
 from urllib.parse import urlparse
 
 headers = {
@@ -18,7 +16,11 @@ headers = {
 }
 
 
-class Workday(BaseScraper):
+class Workday(AsyncBaseScraper):
+    rate_limit = (5, 10)
+    # Largest page the Workday search API accepts
+    page_size = 20
+
     def __init__(self, save: bool, name: str, user_link: str, companyid: int, process_id: int,  is_test: bool = False) -> None:
         parsed_url = urlparse(user_link)
         username = parsed_url.netloc.split(".")[0]
@@ -33,53 +35,75 @@ class Workday(BaseScraper):
             is_test=is_test,
             process_id=process_id,
         ) 
+        # Public site of the tenant: externalUrl is this plus the posting's externalPath
+        self.site_url = f"https://{domain}/{path}"
+        # job link -> its jobPostings entry, the card of the listing diff
+        self._cards: dict[str, dict] = {}
 
-    def get_positions(self) -> list[str]:
-        print(f'LINK = {self.link}')
-        jobs = []
-        offset = 0
-        limit = 20
-        total = 0
-        
-        while True:
-            print(f"OFFSET - {offset} | LIMIT - {limit}")
-            json_data = {
-                'appliedFacets': {},
-                'limit': limit,
-                'offset': offset,
-                'searchText': '',
+    async def _search_page(self, offset: int) -> tuple[list[str], int]:
+        """(job links, total) of the listing page starting at offset"""
+        json_data = {
+            'appliedFacets': {},
+            'limit': self.page_size,
+            'offset': offset,
+            'searchText': '',
+        }
+        response = await self.client.post(f"{self.link}", timeout=60, headers=headers, json=json_data)
+        response.raise_for_status()
+        json_data = response.json()
+        postings = json_data["jobPostings"]
+        print(f"OFFSET - {offset} | FETCHED JOBS - {len(postings)}")
+        links = []
+        for job in postings:
+            link = f"{self.domain}{job['externalPath']}"
+            self._cards[link] = {
+                "title": job.get("title"),
+                "locationsText": job.get("locationsText"),
+                "postedOn": job.get("postedOn"),
             }
-            response = requests.post(f"{self.link}", timeout=60, headers=headers, json=json_data)
-            json_data = response.json()
-            postings = json_data["jobPostings"]
-            
-            if total == 0:
-                total = json_data["total"]
-            
-            print(f"FETCHED JOBS - {len(postings)} | TOTAL - {total}") 
-            
-            if not postings:
-                break
-            
-            for job in postings:
-                job_path = job['externalPath']
-                job_link = f'{self.domain}{job_path}'
-                jobs.append(job_link)
-            
-            # Check if we've collected all jobs
-            if len(jobs) >= total:
-                break
+            links.append(link)
+        return links, json_data.get("total", 0)
+
+    async def get_positions(self) -> AsyncIterator[str]:
+        """Job links, the pages after the first one are fetched concurrently.
+
+        Only the first response carries the real total (later pages can report
+        0), so every remaining offset is known once it is back.
+        """
+        print(f'LINK = {self.link}')
+        jobs, total = await self._search_page(0)
+        print(f"TOTAL - {total}")
+        seen = set()
+
+        def new_jobs(page: list[str]):
+            for job_link in page:
+                if job_link not in seen:
+                    seen.add(job_link)
+                    yield job_link
+
+        for job_link in new_jobs(jobs):
+            yield job_link
+        if not jobs or self.is_test:
+            return
+
+        async def fetch(offset: int) -> list[str]:
+            page, _ = await self._search_page(offset)
+            return page
+
+        async for page in self._fetch_pages(fetch, range(self.page_size, total, self.page_size)):
+            for job_link in new_jobs(page):
+                yield job_link
+        print(f"ALL JOBS - {len(seen)}")
+
+    def position_key(self, link: str) -> str:
+        # The API link of a posting, as its stored scrapedsource (externalUrl)
+        return f"{self.site_url}{link[len(self.domain):]}"
 
-            if (self.is_test):
-                break
-                
-            offset += limit
-        
-        return jobs
+    def listing_card(self, link: str) -> dict | None:
+        return self._cards.get(link)
 
-    def get_position_details(self, link: str) -> dict | None:
-        sleep(0.5)
-        response = requests.get(
+    async def get_position_details(self, link: str) -> dict | None:
+        response = await self.client.get(
             link,
             headers=headers,
         )
@@ -93,7 +117,6 @@ class Workday(BaseScraper):
         jobaddress = job_info['location']
 
         job_dict = {
-            "jobid": int(time.time()),
             "companyid": self.companyid,
             "jobposition": jobposition,
             "jobdescription": jobdescription,
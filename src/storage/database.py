@@ -1,21 +1,40 @@
 import sys
 sys.path.append('.')
 
-from sqlmodel import Session, create_engine, select
-from src.storage.model import jobs, scraperStatus
+from functools import cached_property
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.engine import Engine
+from sqlmodel import Session, delete, select, update
+from src.storage.engine import get_engine
+from src.storage.model import jobs, listingSnapshot, scraperStatus, scrapedPosition
+from src.storage.writer import BackgroundJobWriter, get_job_writer
 from config.config import DB_USER, DB_PASSWORD, DB_HOST, DB_DATABASE
 
 
+MYSQL_URL = f"mysql+pymysql://{DB_USER}:{DB_PASSWORD}@{DB_HOST}/{DB_DATABASE}"
+SQLITE_URL = "sqlite:///scraper.db"
+
+
 class Database:
-    def __init__(self) -> None:
-        self.engine = create_engine(f"mysql+pymysql://{DB_USER}:{DB_PASSWORD}@{DB_HOST}/{DB_DATABASE}")
-        self.engine2 = create_engine("sqlite:///scraper.db")
-        self.create_db_and_tables()
+    """Engines come from a process-wide registry: they are created, and their
+    tables checked, the first time any Database of the process uses them."""
+
+    @property
+    def engine(self) -> Engine:
+        return get_engine(MYSQL_URL, tables=[jobs.__table__])
+
+    @property
+    def engine2(self) -> Engine:
+        return get_engine(SQLITE_URL, tables=[scraperStatus.__table__, scrapedPosition.__table__, listingSnapshot.__table__])
 
+    @cached_property
+    def job_writer(self) -> BackgroundJobWriter:
+        return get_job_writer(self.engine)
 
     def create_db_and_tables(self):
-        jobs.metadata.create_all(self.engine) 
-        scraperStatus.metadata.create_all(self.engine2)
+        """Create the tables now instead of on first use"""
+        self.engine
+        self.engine2
 
     def get_jobs(self) -> list[dict]:
         with Session(bind=self.engine) as session:
@@ -26,29 +45,104 @@ class Database:
         return []
 
     def send_job(self, job: jobs):
-        """Send all jobs to database"""
+        """Queue a job, it is written by the background writer"""
+        self.job_writer.add(job, owner=self)
+
+    def flush_jobs(self) -> tuple[set[int], set[int]]:
+        """Wait until the jobs queued by this Database are written, other
+        scrapers sharing the writer keep going. Returns the (committed, failed) jobids."""
+        committed, failed = self.job_writer.drain(self)
+        print(f"JOB WRITER - {self.job_writer.stats()}")
+        return committed, failed
+
+    def get_known_sources(self, companyid: int) -> set[str]:
+        """scrapedsource of every job already stored for a company"""
+        with Session(bind=self.engine) as session:
+            stmt = select(jobs.scrapedsource).where(jobs.companyid == companyid)
+            return set(session.exec(stmt).all())
+
+    # ------------------------------------------------
+    def get_scraped_positions(self, platform: str) -> dict[str, float]:
+        """position -> timestamp of its last successful scrape"""
+        with Session(bind=self.engine2) as session:
+            stmt = select(scrapedPosition.position, scrapedPosition.last_scraped).where(scrapedPosition.platform == platform)
+            return dict(session.exec(stmt).all())
+
+    def mark_positions_scraped(self, platform: str, positions: list[str], when: float) -> None:
+        with Session(bind=self.engine2) as session:
+            # Chunks keep us under SQLite's bound parameters limit
+            for start in range(0, len(positions), 500):
+                stmt = sqlite_insert(scrapedPosition).values([
+                    {"platform": platform, "position": position, "last_scraped": when}
+                    for position in positions[start:start + 500]
+                ])
+                stmt = stmt.on_conflict_do_update(
+                    index_elements=["platform", "position"],
+                    set_={"last_scraped": stmt.excluded.last_scraped},
+                )
+                session.exec(stmt)
+            session.commit()
+
+    # ------------------------------------------------
+    def get_listing_snapshot(self, platform: str) -> dict[str, tuple[str, int | None]]:
+        """position -> (card hash, jobid) of the listing seen by the last run"""
+        with Session(bind=self.engine2) as session:
+            stmt = select(listingSnapshot.position, listingSnapshot.card_hash, listingSnapshot.jobid).where(listingSnapshot.platform == platform)
+            return {position: (card_hash, jobid) for position, card_hash, jobid in session.exec(stmt).all()}
+
+    def save_listing_snapshot(self, platform: str, cards: list[tuple[str, str, int | None]]) -> None:
+        """Upsert (position, card hash, jobid) rows"""
+        with Session(bind=self.engine2) as session:
+            for start in range(0, len(cards), 500):
+                stmt = sqlite_insert(listingSnapshot).values([
+                    {"platform": platform, "position": position, "card_hash": card_hash, "jobid": jobid}
+                    for position, card_hash, jobid in cards[start:start + 500]
+                ])
+                stmt = stmt.on_conflict_do_update(
+                    index_elements=["platform", "position"],
+                    set_={"card_hash": stmt.excluded.card_hash, "jobid": stmt.excluded.jobid},
+                )
+                session.exec(stmt)
+            session.commit()
+
+    def delete_listing_snapshot(self, platform: str, positions: list[str]) -> None:
+        with Session(bind=self.engine2) as session:
+            for start in range(0, len(positions), 500):
+                stmt = delete(listingSnapshot).where(
+                    listingSnapshot.platform == platform,
+                    listingSnapshot.position.in_(positions[start:start + 500]),
+                )
+                session.exec(stmt)
+            session.commit()
+
+    def set_jobs_status(self, jobids: list[int], status: str, only_if: str | None = None) -> int:
+        """Bulk jobstatus update, only_if restricts it to the jobs currently in that status"""
+        updated = 0
         with Session(bind=self.engine) as session:
-            session.add(job)
+            for start in range(0, len(jobids), 1000):
+                stmt = update(jobs).where(jobs.jobid.in_(jobids[start:start + 1000])).values(jobstatus=status)
+                if only_if is not None:
+                    stmt = stmt.where(jobs.jobstatus == only_if)
+                updated += session.exec(stmt).rowcount
             session.commit()
-        print("JOB SENT")
+        return updated
 
     # ------------------------------------------------
     def update_status(self, info: scraperStatus) -> None:
         with Session(bind=self.engine2) as session:
-            stmt = select(scraperStatus).where(scraperStatus.platform == info.platform)
-            status = session.exec(stmt).first()
-            if status:
-                # Update existing record
-                status.total = info.total
-                status.current = info.current
-                status.successful = info.successful
-                status.failed = info.failed
-                status.status = info.status
-                status.last_updated = info.last_updated
-            else:
-                # Create new record
+            # Single indexed UPDATE, the record is only created on the first run
+            stmt = update(scraperStatus).where(scraperStatus.platform == info.platform).values(
+                total=info.total,
+                current=info.current,
+                successful=info.successful,
+                failed=info.failed,
+                status=info.status,
+                last_updated=info.last_updated,
+                process_id=info.process_id,
+            )
+            if not session.exec(stmt).rowcount:
                 session.add(info)
-            
+
             session.commit()
 
     def update_process_id(self, platform: str, process_id: int) -> None:
@@ -0,0 +1,106 @@
+import os
+import threading
+from sqlalchemy import BigInteger, Table, event, inspect, text
+from sqlalchemy.schema import CreateColumn
+from sqlalchemy.engine import Engine
+from sqlmodel import SQLModel, create_engine
+from config.config import DB_MAX_OVERFLOW, DB_POOL_RECYCLE, DB_POOL_SIZE, DB_POOL_TIMEOUT
+
+
+_engines: dict[str, Engine] = {}
+_created: set[tuple[str, str]] = set()
+_lock = threading.Lock()
+
+
+def _create_engine(url: str) -> Engine:
+    if url.startswith("sqlite"):
+        # Scraper threads share the engine
+        engine = create_engine(url, connect_args={"check_same_thread": False})
+        event.listen(engine, "connect", _sqlite_pragmas)
+        return engine
+    return create_engine(
+        url,
+        pool_size=DB_POOL_SIZE,
+        max_overflow=DB_MAX_OVERFLOW,
+        pool_timeout=DB_POOL_TIMEOUT,
+        pool_recycle=DB_POOL_RECYCLE,
+        pool_pre_ping=True,
+    )
+
+
+def _sqlite_pragmas(connection, _) -> None:
+    # WAL lets the dashboard read while a scraper writes, busy_timeout waits for the lock instead of failing
+    cursor = connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA busy_timeout=5000")
+    cursor.close()
+
+
+def _add_missing_columns(engine: Engine, table: Table) -> None:
+    existing = {column["name"] for column in inspect(engine).get_columns(table.name)}
+    added = [
+        column for column in table.columns
+        if column.name not in existing and (column.nullable or column.server_default is not None)
+    ]
+    if not added:
+        return
+    with engine.begin() as connection:
+        for column in added:
+            print(f"Adding the column {table.name}.{column.name}")
+            ddl = CreateColumn(column).compile(dialect=engine.dialect)
+            connection.execute(text(f"ALTER TABLE {engine.dialect.identifier_preparer.format_table(table)} ADD COLUMN {ddl}"))
+
+
+def _widen_integer_columns(engine: Engine, table: Table) -> None:
+    """Turn INT columns declared BigInteger since into BIGINT (jobid holds 64-bit
+    hashes). SQLite integers are already 64-bit, only MySQL is migrated."""
+    if engine.dialect.name != "mysql":
+        return
+    existing = {column["name"]: column["type"] for column in inspect(engine).get_columns(table.name)}
+    widened = [
+        column for column in table.columns
+        if isinstance(column.type, BigInteger) and column.name in existing
+        and not isinstance(existing[column.name], BigInteger)
+    ]
+    if not widened:
+        return
+    with engine.begin() as connection:
+        for column in widened:
+            print(f"Changing the column {table.name}.{column.name} from {existing[column.name]} to BIGINT")
+            ddl = CreateColumn(column).compile(dialect=engine.dialect)
+            connection.execute(text(f"ALTER TABLE {engine.dialect.identifier_preparer.format_table(table)} MODIFY COLUMN {ddl}"))
+
+
+def get_engine(url: str, tables: list[Table] | None = None) -> Engine:
+    """Engine shared by the whole process, created on first use.
+
+    The given tables are created the first time they are requested for this url.
+    """
+    with _lock:
+        engine = _engines.get(url)
+        if engine is None:
+            engine = _engines[url] = _create_engine(url)
+
+        missing = [table for table in tables or [] if (url, table.name) not in _created]
+        if missing:
+            SQLModel.metadata.create_all(engine, tables=missing)
+            # create_all skips existing tables, add the columns and indexes declared since
+            for table in missing:
+                _add_missing_columns(engine, table)
+                _widen_integer_columns(engine, table)
+                for index in table.indexes:
+                    index.create(engine, checkfirst=True)
+            _created.update((url, table.name) for table in missing)
+    return engine
+
+
+def _reset_after_fork() -> None:
+    # Pooled connections belong to the parent (app.py starts scrapers with multiprocessing)
+    global _lock
+    _lock = threading.Lock()
+    for engine in _engines.values():
+        engine.dispose(close=False)
+
+
+os.register_at_fork(after_in_child=_reset_after_fork)
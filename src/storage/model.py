@@ -1,9 +1,11 @@
+from sqlalchemy import BigInteger, Column, String
 from sqlmodel import Field, SQLModel
 
 
 class jobs(SQLModel, table=True):
     __table_args__ = {'extend_existing': True}
-    jobid:  int = Field(primary_key=True)
+    # Derived from the company and the job source, see src.utils.jobid
+    jobid: int = Field(default=None, sa_column=Column(BigInteger, primary_key=True, autoincrement=False))
     companyid: int 
     jobposition: str = ""
     jobdescription: str = ""
@@ -18,12 +20,14 @@ class jobs(SQLModel, table=True):
     scrapedsource: str
     editpin: str = "end"
     jobscraper: str = "Loicx"
+    # Hash of the scraped content, unchanged jobs are not rewritten (see src.storage.writer)
+    jobfingerprint: str = Field(default="", sa_column=Column(String(16), nullable=False, server_default=""))
 
 
 class scraperStatus(SQLModel, table=True):
     __table_args__ = {'extend_existing': True}
     id: int = Field(default=None, primary_key=True)  # Auto-incrementing primary key
-    platform: str
+    platform: str = Field(index=True)
     total: int
     current: int
     successful: int
@@ -31,3 +35,21 @@ class scraperStatus(SQLModel, table=True):
     status: str
     last_updated: str
     process_id: int = 0
+
+
+class scrapedPosition(SQLModel, table=True):
+    """Local index of the positions already scraped, used by incremental runs"""
+    __table_args__ = {'extend_existing': True}
+    platform: str = Field(primary_key=True)
+    position: str = Field(primary_key=True)
+    last_scraped: float
+
+
+class listingSnapshot(SQLModel, table=True):
+    """Listing seen by the last run of each scraper, used to diff the next one"""
+    __table_args__ = {'extend_existing': True}
+    platform: str = Field(primary_key=True)
+    position: str = Field(primary_key=True)
+    # Hash of the listing card, a different hash means the posting changed
+    card_hash: str
+    jobid: int | None = Field(default=None, sa_column=Column(BigInteger, nullable=True))
@@ -0,0 +1,268 @@
+import queue
+import threading
+import time
+from sqlalchemy.exc import DBAPIError, OperationalError
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.engine import Engine
+from sqlmodel import Session, select
+from src.storage.model import jobs
+from config.config import DB_BATCH_SIZE, DB_FLUSH_INTERVAL, DB_QUEUE_SIZE
+
+
+# Columns owned by the back office, a re-scrape must not overwrite them
+PRESERVED_COLUMNS = {"jobid", "jobstatus", "editpin", "jobscraper"}
+
+
+def _unavailable(error: Exception) -> bool:
+    """The database could not take any row (connection lost, locked), as
+    opposed to rejecting some of the rows"""
+    return isinstance(error, OperationalError) or (isinstance(error, DBAPIError) and error.connection_invalidated)
+
+
+class JobWriter:
+    """Buffer validated jobs and write them with multi-row upserts.
+
+    The buffer is flushed when it holds batch_size jobs, when flush_interval
+    seconds went by since the last flush, and on close(). A batch the database
+    rejects is split in halves until the bad rows are found: the others are
+    committed, the bad ones logged and dropped. When the database is
+    unavailable the rows stay buffered and the next try waits flush_interval.
+    """
+
+    def __init__(self, engine: Engine, batch_size: int = DB_BATCH_SIZE, flush_interval: float = DB_FLUSH_INTERVAL) -> None:
+        self.engine = engine
+        self.batch_size = max(1, batch_size)
+        self.flush_interval = flush_interval
+        self.buffer: dict[int, dict] = {}
+        # jobid -> owner (the scraper) of the buffered row, see BackgroundJobWriter.drain()
+        self.owners: dict[int, object] = {}
+        # owner -> jobids committed / dropped since its last report()
+        self.committed: dict[object, set[int]] = {}
+        self.failed: dict[object, set[int]] = {}
+        self.written = 0
+        # Jobs whose stored fingerprint was already the same, not written again
+        self.unchanged = 0
+        # Jobs the database refused, dropped
+        self.rejected = 0
+        self.flushes = 0
+        self.flush_seconds = 0.0
+        self.max_flush_seconds = 0.0
+        self._last_flush = time.monotonic()
+        # After a failed flush, a full buffer waits for this time instead of retrying on every add()
+        self._retry_at = 0.0
+
+    def add(self, job: jobs, owner: object = None) -> None:
+        # Keyed by jobid: the last version of a posting wins within a batch
+        self.buffer[job.jobid] = job.model_dump()
+        self.owners[job.jobid] = owner
+        now = time.monotonic()
+        if now - self._last_flush >= self.flush_interval or (len(self.buffer) >= self.batch_size and now >= self._retry_at):
+            self.flush()
+
+    def _upsert(self, rows: list[dict]):
+        dialect = self.engine.dialect.name
+        update_columns = [column for column in rows[0] if column not in PRESERVED_COLUMNS]
+        if dialect == "mysql":
+            stmt = mysql_insert(jobs).values(rows)
+            return stmt.on_duplicate_key_update({column: stmt.inserted[column] for column in update_columns})
+        if dialect == "sqlite":
+            stmt = sqlite_insert(jobs).values(rows)
+            return stmt.on_conflict_do_update(
+                index_elements=["jobid"],
+                set_={column: stmt.excluded[column] for column in update_columns},
+            )
+        raise NotImplementedError(f"No upsert for the {dialect} dialect")
+
+    @staticmethod
+    def _changed(session: Session, rows: list[dict]) -> list[dict]:
+        """Rows whose content differs from the stored one, one indexed SELECT per batch"""
+        stmt = select(jobs.jobid, jobs.jobfingerprint).where(jobs.jobid.in_([row["jobid"] for row in rows]))
+        stored = dict(session.exec(stmt).all())
+        return [row for row in rows if not row["jobfingerprint"] or stored.get(row["jobid"]) != row["jobfingerprint"]]
+
+    def _write_rows(self, rows: list[dict]) -> int:
+        start = time.perf_counter()
+        with Session(bind=self.engine) as session:
+            changed = self._changed(session, rows)
+            if changed:
+                session.exec(self._upsert(changed))
+                session.commit()
+        elapsed = time.perf_counter() - start
+        self.written += len(changed)
+        self.unchanged += len(rows) - len(changed)
+        self.flushes += 1
+        self.flush_seconds += elapsed
+        self.max_flush_seconds = max(self.max_flush_seconds, elapsed)
+        print(f"{len(changed)} JOBS SENT, {len(rows) - len(changed)} UNCHANGED ({elapsed * 1000:.0f} ms)")
+        return len(changed)
+
+    def _forget(self, jobids, outcome: dict[object, set[int]]) -> None:
+        for jobid in jobids:
+            del self.buffer[jobid]
+            outcome.setdefault(self.owners.pop(jobid), set()).add(jobid)
+
+    def _write_split(self, jobids: list[int]) -> int:
+        """Write the rows of jobids, halving a batch the database rejects"""
+        try:
+            sent = self._write_rows([self.buffer[jobid] for jobid in jobids])
+        except Exception as e:
+            if _unavailable(e):
+                raise
+            if len(jobids) == 1:
+                self.rejected += 1
+                print(f"❌ Job {jobids[0]} rejected: {getattr(e, 'orig', None) or e}")
+                self._forget(jobids, self.failed)
+                return 0
+            middle = len(jobids) // 2
+            return self._write_split(jobids[:middle]) + self._write_split(jobids[middle:])
+        self._forget(jobids, self.committed)
+        return sent
+
+    def flush(self) -> int:
+        """Write the buffered jobs that changed, return how many were sent"""
+        self._last_flush = time.monotonic()
+        if not self.buffer:
+            return 0
+        try:
+            return self._write_split(list(self.buffer))
+        except Exception:
+            # Only forget the rows once they are committed, they are retried later
+            self._retry_at = time.monotonic() + self.flush_interval
+            raise
+
+    def pending(self, owner: object) -> list[int]:
+        """jobid of the jobs of owner still buffered"""
+        return [jobid for jobid, other in self.owners.items() if other is owner]
+
+    def discard(self, owner: object) -> None:
+        """Drop the jobs of owner, they are not retried with the others"""
+        self._forget(self.pending(owner), self.failed)
+
+    def report(self, owner: object) -> tuple[set[int], set[int]]:
+        """(committed, failed) jobids of owner since the last report"""
+        return self.committed.pop(owner, set()), self.failed.pop(owner, set())
+
+    def close(self) -> None:
+        self.flush()
+
+
+class _Drain:
+    """Queued after an owner's jobs: the writer thread flushes, then reports"""
+
+    def __init__(self, owner: object) -> None:
+        self.owner = owner
+        self.done = threading.Event()
+        self.committed: set[int] = set()
+        self.failed: set[int] = set()
+
+
+class BackgroundJobWriter:
+    """Run a JobWriter in a thread fed by a bounded queue.
+
+    Scrapers only wait on the database when the queue is full. drain() waits
+    until the jobs an owner queued are written and tells which were committed
+    and which were dropped, without stopping the thread shared by the other
+    scrapers; close() writes everything still queued and raises if the last
+    flush failed.
+    """
+
+    _STOP = object()
+
+    def __init__(self, engine: Engine, queue_size: int = DB_QUEUE_SIZE, **kwargs) -> None:
+        self.writer = JobWriter(engine, **kwargs)
+        self.queue: queue.Queue = queue.Queue(maxsize=queue_size)
+        self.max_queue_depth = 0
+        self.error: Exception | None = None
+        self._thread: threading.Thread | None = None
+        self._lock = threading.Lock()
+
+    def _start(self) -> None:
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="job-writer", daemon=True)
+                self._thread.start()
+
+    def add(self, job: jobs, owner: object = None) -> None:
+        self._start()
+        self.queue.put((job, owner))
+        self.max_queue_depth = max(self.max_queue_depth, self.queue.qsize())
+
+    def _write(self, job: jobs | None, owner: object = None) -> None:
+        try:
+            if job is None:
+                self.writer.flush()
+            else:
+                self.writer.add(job, owner)
+            self.error = None
+        except Exception as e:
+            # The rows stay buffered and go with the next flush
+            self.error = e
+            print(f"❌ Could not write {len(self.writer.buffer)} jobs: {str(e)}")
+
+    def _run(self) -> None:
+        while True:
+            try:
+                job = self.queue.get(timeout=self.writer.flush_interval)
+            except queue.Empty:
+                self._write(None)
+                continue
+            if job is self._STOP:
+                self._write(None)
+                return
+            if isinstance(job, _Drain):
+                self._write(None)
+                if self.writer.pending(job.owner):
+                    print(f"❌ {len(self.writer.pending(job.owner))} jobs left unwritten: {self.error}")
+                    # The owner's run counts them as failed and scrapes them again next time
+                    self.writer.discard(job.owner)
+                job.committed, job.failed = self.writer.report(job.owner)
+                job.done.set()
+                continue
+            self._write(*job)
+
+    def stats(self) -> dict:
+        flushes = self.writer.flushes
+        return {
+            "queue_depth": self.queue.qsize(),
+            "max_queue_depth": self.max_queue_depth,
+            "buffered": len(self.writer.buffer),
+            "written": self.writer.written,
+            "unchanged": self.writer.unchanged,
+            "rejected": self.writer.rejected,
+            "flushes": flushes,
+            "avg_flush_ms": round(self.writer.flush_seconds / flushes * 1000, 1) if flushes else 0.0,
+            "max_flush_ms": round(self.writer.max_flush_seconds * 1000, 1),
+        }
+
+    def drain(self, owner: object) -> tuple[set[int], set[int]]:
+        """Wait until the jobs queued by owner are written, return the
+        (committed, failed) jobids since its last drain"""
+        request = _Drain(owner)
+        self._start()
+        self.queue.put(request)
+        request.done.wait()
+        return request.committed, request.failed
+
+    def close(self) -> None:
+        with self._lock:
+            thread = self._thread
+        if thread is not None and thread.is_alive():
+            self.queue.put(self._STOP)
+            thread.join()
+        print(f"JOB WRITER - {self.stats()}")
+        if self.error is not None:
+            raise self.error
+
+
+_writers: dict[int, BackgroundJobWriter] = {}
+_writers_lock = threading.Lock()
+
+
+def get_job_writer(engine: Engine) -> BackgroundJobWriter:
+    """Background writer shared by every scraper of the process"""
+    with _writers_lock:
+        writer = _writers.get(id(engine))
+        if writer is None:
+            writer = _writers[id(engine)] = BackgroundJobWriter(engine)
+        return writer
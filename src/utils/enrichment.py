@@ -0,0 +1,66 @@
+import atexit
+import multiprocessing
+import os
+import threading
+from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor
+from src.utils.experience import extract_years
+from src.utils.qualifications import extract_qualification
+from config.config import ENRICH_MIN_BATCH, ENRICH_PROCESSES
+
+
+def experience_level(jobdescription: str) -> str:
+    years = extract_years(jobdescription)
+    if not years:
+        return "General"
+    return "Highly Experienced" if years[0] > 20 else f"{years[0]}-years"
+
+
+def enrich_text(task: tuple[str, bool, bool]) -> tuple[str | None, str | None]:
+    """(jobdescription, need_qualifications, need_experience) -> (qualifications, experience)
+
+    The CPU heavy part of validate_data, a plain function so it can run in a process pool.
+    """
+    jobdescription, need_qualifications, need_experience = task
+    return (
+        extract_qualification(jobdescription) if need_qualifications else None,
+        experience_level(jobdescription) if need_experience else None,
+    )
+
+
+_pool: ProcessPoolExecutor | None = None
+_pool_lock = threading.Lock()
+
+
+def _pool_context():
+    """Workers never come from fork(): the pool is created once scraper, writer and
+    HTTP threads run, and a forked child could inherit a lock held by one of them.
+    The forkserver is started by exec and stays single-threaded, workers fork from it."""
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        context = multiprocessing.get_context("forkserver")
+        # Forked by the server with the keyword automaton already built
+        context.set_forkserver_preload([__name__])
+        return context
+    return multiprocessing.get_context("spawn")
+
+
+def get_process_pool() -> ProcessPoolExecutor | None:
+    """Process pool shared by the whole process, None when ENRICH_PROCESSES is 1"""
+    global _pool
+    processes = ENRICH_PROCESSES or os.cpu_count() or 1
+    if processes <= 1:
+        return None
+    with _pool_lock:
+        if _pool is None:
+            _pool = ProcessPoolExecutor(max_workers=processes, mp_context=_pool_context())
+            atexit.register(_pool.shutdown, cancel_futures=True)
+        return _pool
+
+
+def enrich_many(tasks: list[tuple[str, bool, bool]]) -> Iterable[tuple[str | None, str | None]]:
+    """enrich_text over a batch, spread over the process pool when the batch is big enough"""
+    pool = get_process_pool() if len(tasks) >= ENRICH_MIN_BATCH else None
+    if pool is None:
+        return map(enrich_text, tasks)
+    chunksize = max(1, len(tasks) // (pool._max_workers * 4))
+    return pool.map(enrich_text, tasks, chunksize=chunksize)
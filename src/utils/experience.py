@@ -0,0 +1,68 @@
+import re
+
+
+NUMBER_WORDS = {
+    "one": 1, "two": 2, "three": 3, "four": 4, "five": 5,
+    "six": 6, "seven": 7, "eight": 8, "nine": 9, "ten": 10,
+    "eleven": 11, "twelve": 12, "thirteen": 13, "fourteen": 14,
+    "fifteen": 15, "sixteen": 16, "seventeen": 17, "eighteen": 18,
+    "nineteen": 19, "twenty": 20,
+}
+
+# Longest words first so that "seventeen" is not read as "seven"
+_NUMBER = r"\d+|\b(?:" + "|".join(sorted(NUMBER_WORDS, key=len, reverse=True)) + r")\b"
+
+# "5 years", "5+ years", "3-5 years", "three to five years", "10 or more years".
+# Only matched right before a "year" found by YEAR_PATTERN: scanning the whole
+# text with the number alternatives would try them at every character.
+EXPERIENCE_PATTERN = re.compile(
+    rf"(?P<low>{_NUMBER})"
+    rf"(?:\s*(?:[-–—]|\bto\b)\s*(?P<high>{_NUMBER}))?"
+    r"(?:(?P<or_more>\s+or\s+more)|\+)?"
+    r"\s+$",
+    re.IGNORECASE,
+)
+YEAR_PATTERN = re.compile("year", re.IGNORECASE)
+# Longest "seventeen to eighteen or more " in front of "years", with some margin
+WINDOW = 80
+
+
+def _to_int(number: str) -> int:
+    return int(number) if number.isdigit() else NUMBER_WORDS[number.lower()]
+
+
+def experience_mentions(text: str) -> list[tuple[int, int | None, bool]]:
+    """(low, high, or_more) for every experience mentioned, in one pass over the text"""
+    mentions = []
+    if not text:
+        return mentions
+    for year in YEAR_PATTERN.finditer(text):
+        match = EXPERIENCE_PATTERN.search(text, max(0, year.start() - WINDOW), year.start())
+        if match:
+            mentions.append((
+                _to_int(match["low"]),
+                _to_int(match["high"]) if match["high"] else None,
+                bool(match["or_more"]),
+            ))
+    return mentions
+
+
+def extract_years(text: str) -> list[int]:
+    """Years of experience mentioned in the text, "X or more years" first.
+
+    A range counts for its upper bound.
+    """
+    or_more = []
+    others = []
+    for low, high, is_or_more in experience_mentions(text):
+        years = max(low, high) if high is not None else low
+        (or_more if is_or_more else others).append(years)
+    return or_more + others
+
+
+def extract_year_range(text: str) -> tuple[int, int] | None:
+    """First "X-Y years" range of the text"""
+    for low, high, _ in experience_mentions(text):
+        if high is not None:
+            return low, high
+    return None
@@ -0,0 +1,311 @@
+import json
+import mmap
+import os
+import re
+import struct
+import unicodedata
+from collections.abc import Iterable
+from functools import lru_cache
+from hashlib import blake2b
+from typing import NamedTuple
+import numpy as np
+import pycountry
+from config.config import GAZETTEER_FILE
+
+
+# Kinds of places, also their priority when the same name means several things
+COUNTRY, REGION, CITY = 0, 1, 2
+NO_REGION = 0xFFFFFFFF
+MAGIC = b"GAZ1"
+
+# Subdivisions whose code is written after a city ("Charlotte, NC", "Toronto, ON")
+REGION_CODE_COUNTRIES = ("US", "CA", "AU")
+COUNTRY_ALIASES = {
+    "GB": ["UK", "Great Britain", "England", "Scotland", "Wales", "Northern Ireland"],
+    "US": ["U.S.", "U.S.A.", "America"],
+    "KR": ["Korea"],
+    "AE": ["UAE"],
+    "RU": ["Russia"],
+    "VN": ["Vietnam"],
+    "TR": ["Turkey"],
+    "CZ": ["Czech Republic"],
+    "CI": ["Ivory Coast"],
+    "NL": ["Holland"],
+}
+# Words that are also place names ("Remote, OR") but never mean one in a job location
+IGNORED_WORDS = {"remote", "hybrid", "home", "office", "onsite", "on site", "multiple locations", "various"}
+
+SPLIT_PATTERN = re.compile(r"[,;/|()\n]+|\s+[-–—]\s+")
+WORD_PATTERN = re.compile(r"[^\W\d_]+(?:['.-][^\W\d_]+)*")
+
+
+class Place(NamedTuple):
+    kind: int
+    country: str
+    name: str
+    region: str
+    # Found through a code ("NC", "USA") rather than a name
+    code: bool = False
+
+
+class Location(NamedTuple):
+    city: str = ""
+    region: str = ""
+    country: str = ""
+
+
+def normalize_name(text: str) -> str:
+    """"São Paulo " -> "sao paulo": no accents, no punctuation, lower case"""
+    if not text.isascii():
+        text = unicodedata.normalize("NFKD", text)
+        text = "".join(char for char in text if not unicodedata.combining(char))
+    return " ".join(re.sub(r"[^\w]+", " ", text.casefold()).split())
+
+
+def name_hash(key: str) -> int:
+    return int.from_bytes(blake2b(key.encode(), digest_size=8).digest(), "little")
+
+
+def _code_key(code: str) -> str:
+    # Codes live in their own namespace, they are only matched in upper case
+    return f"#{code}"
+
+
+def country_name(code: str, default: str = "") -> str:
+    """Usual name of a country: "South Korea" rather than "Korea, Republic of" """
+    country = pycountry.countries.get(alpha_2=code)
+    if country is None:
+        return default or code
+    return getattr(country, "common_name", country.name)
+
+
+def pycountry_records() -> Iterable[tuple[str, int, str, str, str]]:
+    """(key, kind, country code, name, region) for countries, their codes and subdivisions"""
+    for country in pycountry.countries:
+        names = {country.name, getattr(country, "official_name", ""), getattr(country, "common_name", "")}
+        names.update(COUNTRY_ALIASES.get(country.alpha_2, []))
+        display_name = country_name(country.alpha_2)
+        for name in filter(None, names):
+            yield normalize_name(name), COUNTRY, country.alpha_2, display_name, ""
+        yield _code_key(country.alpha_2), COUNTRY, country.alpha_2, display_name, ""
+        yield _code_key(country.alpha_3), COUNTRY, country.alpha_2, display_name, ""
+    yield _code_key("UK"), COUNTRY, "GB", country_name("GB"), ""
+
+    for subdivision in pycountry.subdivisions:
+        if subdivision.parent_code:
+            continue
+        yield normalize_name(subdivision.name), REGION, subdivision.country_code, subdivision.name, ""
+        if subdivision.country_code in REGION_CODE_COUNTRIES:
+            code = subdivision.code.split("-", 1)[1]
+            yield _code_key(code), REGION, subdivision.country_code, subdivision.name, ""
+
+
+class Gazetteer:
+    """Sorted 64-bit name hashes with parallel arrays describing each place.
+
+    A lookup is a hash plus a binary search, the arrays can be memory mapped
+    from the file written by scripts/build_gazetteer.py.
+    """
+
+    def __init__(self, countries: list[list[str]], arrays: dict[str, np.ndarray]) -> None:
+        self.country_codes = [code for code, _ in countries]
+        # Files written before the usual names were used still read well
+        self.country_names = {code: country_name(code, name) for code, name in countries}
+        self.keys = arrays["keys"]
+        self.kinds = arrays["kinds"]
+        self.countries = arrays["countries"]
+        self.names = arrays["names"]
+        self.regions = arrays["regions"]
+        self.name_offsets = arrays["name_offsets"]
+        self.name_blob = arrays["name_blob"]
+
+    @classmethod
+    def from_records(cls, records: Iterable[tuple[str, int, str, str, str]]) -> "Gazetteer":
+        country_index: dict[str, int] = {}
+        name_index: dict[str, int] = {}
+        rows = set()
+        for key, kind, country, name, region in records:
+            if not key or key == "#":
+                continue
+            country_id = country_index.setdefault(country, len(country_index))
+            name_id = name_index.setdefault(name, len(name_index))
+            region_id = name_index.setdefault(region, len(name_index)) if region else NO_REGION
+            rows.add((name_hash(key), kind, country_id, name_id, region_id))
+
+        table = np.array(sorted(rows), dtype=np.uint64).reshape(-1, 5)
+        blobs = [name.encode() for name in name_index]
+        arrays = {
+            "keys": table[:, 0].copy(),
+            "kinds": table[:, 1].astype(np.uint8),
+            "countries": table[:, 2].astype(np.uint16),
+            "names": table[:, 3].astype(np.uint32),
+            "regions": table[:, 4].astype(np.uint32),
+            "name_offsets": np.cumsum([0] + [len(blob) for blob in blobs], dtype=np.uint64).astype(np.uint32),
+            "name_blob": np.frombuffer(b"".join(blobs), dtype=np.uint8),
+        }
+        countries = [[code, country_name(code)] for code in country_index]
+        return cls(countries, arrays)
+
+    def save(self, path: str) -> None:
+        arrays = {
+            "keys": self.keys, "kinds": self.kinds, "countries": self.countries, "names": self.names,
+            "regions": self.regions, "name_offsets": self.name_offsets, "name_blob": self.name_blob,
+        }
+        layout = {}
+        offset = 0
+        for name, array in arrays.items():
+            layout[name] = [array.dtype.str, offset, len(array)]
+            # 8-byte alignment so every array can be viewed in place
+            offset += -(-array.nbytes // 8) * 8
+        header = json.dumps({
+            "countries": [[code, self.country_names[code]] for code in self.country_codes],
+            "arrays": layout,
+        }).encode()
+        start = -(-(len(MAGIC) + 4 + len(header)) // 8) * 8
+
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(MAGIC + struct.pack("<I", len(header)) + header)
+            for name, array in arrays.items():
+                f.seek(start + layout[name][1])
+                f.write(array.tobytes())
+            f.truncate(start + offset)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: str) -> "Gazetteer":
+        with open(path, "rb") as f:
+            buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if buffer[:4] != MAGIC:
+            raise ValueError(f"{path} is not a gazetteer file")
+        (header_size,) = struct.unpack_from("<I", buffer, 4)
+        header = json.loads(buffer[8:8 + header_size])
+        start = -(-(8 + header_size) // 8) * 8
+        arrays = {
+            name: np.frombuffer(buffer, dtype=np.dtype(dtype), count=count, offset=start + offset)
+            for name, (dtype, offset, count) in header["arrays"].items()
+        }
+        return cls(header["countries"], arrays)
+
+    def _name(self, name_id: int) -> str:
+        if name_id == NO_REGION:
+            return ""
+        return bytes(self.name_blob[self.name_offsets[name_id]:self.name_offsets[name_id + 1]]).decode()
+
+    def _lookup(self, key: str) -> list[Place]:
+        target = np.uint64(name_hash(key))
+        start = int(np.searchsorted(self.keys, target, side="left"))
+        places = []
+        index = start
+        while index < len(self.keys) and self.keys[index] == target:
+            places.append(Place(
+                int(self.kinds[index]),
+                self.country_codes[self.countries[index]],
+                self._name(int(self.names[index])),
+                self._name(int(self.regions[index])),
+            ))
+            index += 1
+        return places
+
+    def lookup(self, text: str) -> list[Place]:
+        """Places named text, codes ("NC", "USA") only match in upper case"""
+        places = []
+        if 2 <= len(text) <= 3 and text.isupper():
+            places = [place._replace(code=True) for place in self._lookup(_code_key(text))]
+        key = normalize_name(text)
+        if key and key not in IGNORED_WORDS:
+            places += self._lookup(key)
+        return places
+
+    def _matches(self, part: str) -> list[tuple[list[Place], bool]]:
+        """Places of one comma separated part: the whole part, else its pieces and words.
+        Each match tells whether it names the whole part."""
+        places = self.lookup(part)
+        if places:
+            return [(places, True)]
+        if "-" in part:
+            pieces = [self.lookup(piece.strip()) for piece in part.split("-")]
+            if any(pieces):
+                return [(found, True) for found in pieces if found]
+
+        # Longest run of words first: "Greater London Area" -> "greater london", "london"...
+        words = WORD_PATTERN.findall(part)
+        matches = []
+        index = 0
+        while index < len(words):
+            for size in range(min(4, len(words) - index), 0, -1):
+                candidate = " ".join(words[index:index + size])
+                if size == 1 and len(candidate) < 4 and not candidate.isupper():
+                    continue
+                found = self.lookup(candidate)
+                if found:
+                    matches.append((found, False))
+                    index += size
+                    break
+            else:
+                index += 1
+        return matches
+
+    def resolve(self, text: str) -> Location:
+        """City, region and country of a free-text location.
+
+        Every part votes for the countries it can belong to. The country backed by
+        most parts wins. Ties go to a country of the last part ("Jordan, MN" is
+        in Minnesota), then to an explicit country name, then to a region
+        ("Charlotte, NC" is North Carolina, not New Caledonia) unless the text is
+        a single part, then to the last part. A country only found inside a
+        part ("Jersey City", "Panama City") is not explicit, a trailing code is
+        when the text names more than a city ("Mumbai, MH, IN").
+        """
+        parts = [part.strip() for part in SPLIT_PATTERN.split(text or "") if part.strip()]
+        matches = [
+            (index, places, whole)
+            for index, part in enumerate(parts)
+            for places, whole in self._matches(part)
+        ]
+        if not matches:
+            return Location()
+
+        single = len(parts) == 1
+        last = matches[-1][0]
+        scores: dict[str, list] = {}
+        for position, (index, places, whole) in enumerate(matches):
+            for country in {place.country for place in places}:
+                score = scores.setdefault(country, [0, 0, 0, 0, 0])
+                score[0] += 1
+                score[1] = score[1] or index == last
+                score[4] = position
+            for place in places:
+                if place.kind == COUNTRY and whole and (single or not place.code or (index == last and len(parts) > 2)):
+                    scores[place.country][2] = 1
+                elif place.kind == REGION and not single:
+                    scores[place.country][3] = 1
+        country = max(scores, key=lambda code: scores[code])
+
+        region = city = ""
+        for _, places, _ in matches:
+            for place in places:
+                if place.country != country:
+                    continue
+                if place.kind == REGION and not region:
+                    region = place.name
+                elif place.kind == CITY and not city and (not region or place.region in ("", region)):
+                    city = place.name
+        return Location(city, region, self.country_names[country])
+
+
+@lru_cache(maxsize=1)
+def get_gazetteer() -> Gazetteer:
+    """The gazetteer built by scripts/build_gazetteer.py, or countries and regions from pycountry"""
+    if GAZETTEER_FILE and os.path.exists(GAZETTEER_FILE):
+        try:
+            return Gazetteer.load(GAZETTEER_FILE)
+        except (OSError, ValueError) as e:
+            print(f"Ignoring the gazetteer {GAZETTEER_FILE}: {e}")
+    return Gazetteer.from_records(pycountry_records())
+
+
+@lru_cache(maxsize=10000)
+def normalize_location(text: str) -> Location:
+    """Central location normaliser, no network: "Charlotte, NC" -> (Charlotte, North Carolina, United States)"""
+    return get_gazetteer().resolve(text)
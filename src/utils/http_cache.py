@@ -0,0 +1,285 @@
+import hashlib
+import json
+import os
+import struct
+import tempfile
+import threading
+import time
+import zlib
+from collections.abc import Callable
+
+import httpx
+from config.config import HTTP_CACHE, HTTP_CACHE_DIR, HTTP_CACHE_MAX_AGE_DAYS, HTTP_CACHE_MAX_MB
+
+# Headers that describe the stored body and must not be replayed from a 304
+_HOP_HEADERS = {"connection", "keep-alive", "transfer-encoding"}
+
+# A prune frees room down to this share of max_bytes, so the next stores do not walk the cache again
+_PRUNE_TARGET = 0.9
+
+
+class ResponseCache:
+    """Persistent HTTP cache keyed by method, url and request body.
+
+    Only responses carrying an ETag or a Last-Modified are stored. On the
+    next run the request is sent with If-None-Match / If-Modified-Since and a
+    304 is answered from disk. Each entry is one file: a small JSON header
+    followed by the zlib-compressed body. Entries older than `max_age`
+    seconds are evicted, then the oldest ones until the cache fits in
+    `max_bytes`: on start, and whenever the bytes stored since the last prune
+    take it over the limit.
+    """
+
+    def __init__(self, directory: str, max_age: float, max_bytes: int) -> None:
+        self.directory = directory
+        self.max_age = max_age
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        # Bytes on disk as of the last prune, plus every entry stored since
+        self.size = 0
+        self._lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+        self.prune()
+
+    @staticmethod
+    def key(method: str, url: str, body: bytes = b"") -> str:
+        digest = hashlib.sha256(f"{method.upper()} {url}\n".encode())
+        digest.update(body)
+        return digest.hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key[:2], key)
+
+    def load(self, key: str) -> tuple[dict, bytes] | None:
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+            if time.time() - os.path.getmtime(path) > self.max_age:
+                return None
+            (size,) = struct.unpack(">I", data[:4])
+            meta = json.loads(data[4:4 + size])
+            return meta, zlib.decompress(data[4 + size:])
+        except (OSError, ValueError, zlib.error, struct.error):
+            return None
+
+    def store(self, key: str, meta: dict, body: bytes) -> None:
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        header = json.dumps(meta).encode()
+        data = struct.pack(">I", len(header)) + header + zlib.compress(body, 6)
+        fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path))
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
+        with self._lock:
+            # A replaced entry is counted twice, the next prune corrects it
+            self.size += len(data)
+            over = self.size > self.max_bytes
+        if over:
+            self.prune()
+
+    def touch(self, key: str) -> None:
+        """The origin confirmed the entry (304): it is fresh again for eviction"""
+        try:
+            os.utime(self._path(key))
+        except OSError:
+            pass
+
+    @staticmethod
+    def validators(entry: tuple[dict, bytes] | None) -> dict:
+        """Conditional request headers for a cached entry"""
+        if not entry:
+            return {}
+        meta = entry[0]
+        headers = {}
+        if meta.get("etag"):
+            headers["If-None-Match"] = meta["etag"]
+        if meta.get("last_modified"):
+            headers["If-Modified-Since"] = meta["last_modified"]
+        return headers
+
+    @staticmethod
+    def _remove(path: str) -> None:
+        # Another process sharing the directory may have evicted it already
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+    def prune(self) -> None:
+        with self._lock:
+            files = []
+            now = time.time()
+            for root, _, names in os.walk(self.directory):
+                for name in names:
+                    path = os.path.join(root, name)
+                    try:
+                        stat = os.stat(path)
+                    except OSError:
+                        continue
+                    if now - stat.st_mtime > self.max_age:
+                        self._remove(path)
+                    else:
+                        files.append((stat.st_mtime, stat.st_size, path))
+
+            total = sum(size for _, size, _ in files)
+            if total > self.max_bytes:
+                for _, size, path in sorted(files):
+                    if total <= self.max_bytes * _PRUNE_TARGET:
+                        break
+                    self._remove(path)
+                    total -= size
+            self.size = total
+
+    def get_text(self, url: str, send: Callable[[dict], object]) -> str:
+        """Conditional GET for sessions that do not go through httpx (cloudscraper).
+
+        `send` receives the extra request headers and returns a requests.Response.
+        """
+        key = self.key("GET", url)
+        entry = self.load(key)
+        response = send(self.validators(entry))
+        if response.status_code == 304 and entry:
+            self.hits += 1
+            self.touch(key)
+            return entry[1].decode(entry[0].get("encoding") or "utf-8", errors="replace")
+
+        self.misses += 1
+        response.raise_for_status()
+        etag, last_modified = response.headers.get("ETag"), response.headers.get("Last-Modified")
+        if etag or last_modified:
+            # requests already decoded the body, store it as plain bytes
+            self.store(key, {
+                "etag": etag,
+                "last_modified": last_modified,
+                "encoding": response.encoding,
+            }, response.content)
+        return response.text
+
+    # -- httpx transport helpers --------------------------------------------
+
+    def request_key(self, request: httpx.Request) -> str | None:
+        if request.method not in ("GET", "POST"):
+            return None
+        try:
+            body = request.content
+        except httpx.RequestNotRead:
+            return None
+        return self.key(request.method, str(request.url), body)
+
+    @staticmethod
+    def prepare(request: httpx.Request, entry: tuple[dict, bytes] | None) -> None:
+        for name, value in ResponseCache.validators(entry).items():
+            if name not in request.headers:
+                request.headers[name] = value
+
+    @staticmethod
+    def cacheable(response: httpx.Response) -> bool:
+        return response.status_code == 200 and bool(
+            response.headers.get("ETag") or response.headers.get("Last-Modified")
+        )
+
+    @staticmethod
+    def meta(response: httpx.Response) -> dict:
+        return {
+            "status": response.status_code,
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified"),
+            "headers": [
+                (name, value) for name, value in response.headers.multi_items()
+                if name.lower() not in _HOP_HEADERS
+            ],
+        }
+
+    @staticmethod
+    def replay(request: httpx.Request, entry: tuple[dict, bytes]) -> httpx.Response:
+        meta, body = entry
+        return httpx.Response(meta["status"], headers=meta["headers"], content=body, request=request)
+
+
+class CacheTransport(httpx.BaseTransport):
+    """Serve unchanged responses from the disk cache (304 revalidation)"""
+
+    def __init__(self, transport: httpx.BaseTransport, cache: ResponseCache) -> None:
+        self.transport = transport
+        self.cache = cache
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        key = self.cache.request_key(request)
+        if key is None:
+            return self.transport.handle_request(request)
+
+        entry = self.cache.load(key)
+        self.cache.prepare(request, entry)
+        response = self.transport.handle_request(request)
+
+        if response.status_code == 304 and entry:
+            response.close()
+            self.cache.hits += 1
+            self.cache.touch(key)
+            return self.cache.replay(request, entry)
+
+        self.cache.misses += 1
+        if not self.cache.cacheable(response):
+            return response
+
+        # Raw bytes: the client decodes Content-Encoding itself
+        body = b"".join(response.stream)
+        response.close()
+        entry = (self.cache.meta(response), body)
+        self.cache.store(key, *entry)
+        return self.cache.replay(request, entry)
+
+    def close(self) -> None:
+        self.transport.close()
+
+
+class AsyncCacheTransport(httpx.AsyncBaseTransport):
+    def __init__(self, transport: httpx.AsyncBaseTransport, cache: ResponseCache) -> None:
+        self.transport = transport
+        self.cache = cache
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        key = self.cache.request_key(request)
+        if key is None:
+            return await self.transport.handle_async_request(request)
+
+        entry = self.cache.load(key)
+        self.cache.prepare(request, entry)
+        response = await self.transport.handle_async_request(request)
+
+        if response.status_code == 304 and entry:
+            await response.aclose()
+            self.cache.hits += 1
+            self.cache.touch(key)
+            return self.cache.replay(request, entry)
+
+        self.cache.misses += 1
+        if not self.cache.cacheable(response):
+            return response
+
+        body = b"".join([chunk async for chunk in response.stream])
+        await response.aclose()
+        entry = (self.cache.meta(response), body)
+        self.cache.store(key, *entry)
+        return self.cache.replay(request, entry)
+
+    async def aclose(self) -> None:
+        await self.transport.aclose()
+
+
+_response_cache: ResponseCache | None = None
+
+
+def get_response_cache() -> ResponseCache | None:
+    """Process-wide cache, None when HTTP_CACHE is disabled"""
+    global _response_cache
+    if HTTP_CACHE and _response_cache is None:
+        _response_cache = ResponseCache(
+            HTTP_CACHE_DIR,
+            max_age=HTTP_CACHE_MAX_AGE_DAYS * 86400,
+            max_bytes=int(HTTP_CACHE_MAX_MB * 1024 * 1024),
+        )
+    return _response_cache
@@ -0,0 +1,75 @@
+import httpx
+from config.config import (
+    HTTP_CONNECT_TIMEOUT,
+    HTTP_HTTP2,
+    HTTP_KEEPALIVE_EXPIRY,
+    HTTP_MAX_CONNECTIONS,
+    HTTP_MAX_KEEPALIVE,
+    HTTP_TIMEOUT,
+)
+from src.utils.rate_limiter import AsyncRateLimitedTransport, RateLimitedTransport
+from src.utils.retry import AsyncRetryTransport, RetryTransport
+from src.utils.http_cache import AsyncCacheTransport, CacheTransport, get_response_cache
+
+
+def _http2_available() -> bool:
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def client_options(
+    max_connections: int = HTTP_MAX_CONNECTIONS,
+    max_keepalive: int = HTTP_MAX_KEEPALIVE,
+    timeout: float = HTTP_TIMEOUT,
+    http2: bool = HTTP_HTTP2,
+    **kwargs,
+) -> dict:
+    """Keyword arguments shared by the sync and async pooled clients"""
+    if http2 and not _http2_available():
+        print("HTTP/2 requested but the 'h2' package is missing -> falling back to HTTP/1.1")
+        http2 = False
+
+    options = {
+        "limits": httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive,
+            keepalive_expiry=HTTP_KEEPALIVE_EXPIRY,
+        ),
+        "timeout": httpx.Timeout(timeout, connect=HTTP_CONNECT_TIMEOUT),
+        "http2": http2,
+        "follow_redirects": True,
+    }
+    options.update(kwargs)
+    return options
+
+
+def create_client(transport: httpx.BaseTransport | None = None, **kwargs) -> httpx.Client:
+    """Pooled keep-alive client, connections are reused across requests to the same host.
+
+    Every request waits for the per-host rate limiter before it is sent,
+    timeouts, 429 and 5xx are retried with backoff, and unchanged pages are
+    served from the disk cache after a conditional request.
+    """
+    options = client_options(**kwargs)
+    limits, http2 = options.pop("limits"), options.pop("http2")
+    transport = transport or httpx.HTTPTransport(limits=limits, http2=http2)
+    transport = RetryTransport(RateLimitedTransport(transport))
+    cache = get_response_cache()
+    if cache:
+        transport = CacheTransport(transport, cache)
+    return httpx.Client(transport=transport, **options)
+
+
+def create_async_client(transport: httpx.AsyncBaseTransport | None = None, **kwargs) -> httpx.AsyncClient:
+    """Async version of create_client, meant to be shared by many coroutines"""
+    options = client_options(**kwargs)
+    limits, http2 = options.pop("limits"), options.pop("http2")
+    transport = transport or httpx.AsyncHTTPTransport(limits=limits, http2=http2)
+    transport = AsyncRetryTransport(AsyncRateLimitedTransport(transport))
+    cache = get_response_cache()
+    if cache:
+        transport = AsyncCacheTransport(transport, cache)
+    return httpx.AsyncClient(transport=transport, **options)
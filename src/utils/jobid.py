@@ -0,0 +1,41 @@
+from hashlib import blake2b
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+
+# Query parameters that only track where the visitor came from
+TRACKING_PARAMS = ("utm_", "gclid", "fbclid")
+
+
+def canonical_source(url: str) -> str:
+    """Normalise a job url so that the same posting always gives the same string"""
+    parts = urlsplit(url.strip())
+    query = sorted(
+        (key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not key.lower().startswith(TRACKING_PARAMS)
+    )
+    path = parts.path.rstrip("/") or "/"
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), path, urlencode(query), ""))
+
+
+def make_jobid(companyid: int, key: str) -> int:
+    """63-bit id derived from the company and a native requisition id or source url.
+
+    The id is stable across runs and processes, so a re-scrape of the same
+    posting always targets the same row of the jobs table.
+    """
+    digest = blake2b(f"{companyid}:{key}".encode(), digest_size=8).digest()
+    # Drop the top bit so the id fits in a signed BIGINT
+    return int.from_bytes(digest, "big") >> 1
+
+
+# Scraped content of a job, the back office columns (jobstatus, editpin...) are left out
+FINGERPRINT_FIELDS = (
+    "companyid", "jobposition", "jobdescription", "jobqualifications", "jobexperience",
+    "jobpattern", "jobsalary", "jobniche", "jobcountry", "jobaddress", "scrapedsource",
+)
+
+
+def job_fingerprint(job) -> str:
+    """16 hex chars that change whenever a scraped field of the job changes"""
+    content = "\x1f".join(str(getattr(job, field)) for field in FINGERPRINT_FIELDS)
+    return blake2b(content.encode(), digest_size=8).hexdigest()
@@ -0,0 +1,81 @@
+import atexit
+import json
+import os
+import threading
+from collections import OrderedDict
+from country_named_entity_recognition import find_countries
+from config.config import LOCATION_CACHE_FILE, LOCATION_CACHE_SIZE
+
+
+class LocationResolver:
+    """Memoised find_countries: the same location strings come back thousands of times.
+
+    Keeps the last maxsize locations in memory (LRU). With a path, the cache is
+    loaded at start and written back by save(), which also prints the hit rate.
+    """
+
+    def __init__(self, maxsize: int = LOCATION_CACHE_SIZE, path: str = LOCATION_CACHE_FILE) -> None:
+        self.maxsize = max(1, maxsize)
+        self.path = path
+        self.cache: OrderedDict[str, str] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        if path and os.path.exists(path):
+            try:
+                with open(path, encoding="utf-8") as f:
+                    self.cache.update(list(json.load(f).items())[-self.maxsize:])
+            except (OSError, ValueError) as e:
+                print(f"Ignoring the location cache {path}: {e}")
+
+    @staticmethod
+    def key(location: str) -> str:
+        # find_countries is case sensitive, only the spacing is normalised
+        return " ".join(location.split())
+
+    def country(self, location: str) -> str:
+        """Name of the first country found in the location, "" if none"""
+        key = self.key(location or "")
+        if not key:
+            return ""
+
+        with self._lock:
+            country = self.cache.get(key)
+            if country is not None:
+                self.cache.move_to_end(key)
+                self.hits += 1
+                return country
+            self.misses += 1
+
+        found = find_countries(key)
+        country = found[0][0].name if found else ""
+
+        with self._lock:
+            self.cache[key] = country
+            if len(self.cache) > self.maxsize:
+                self.cache.popitem(last=False)
+        return country
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def stats(self) -> dict:
+        return {"size": len(self.cache), "hits": self.hits, "misses": self.misses, "hit_rate": round(self.hit_rate, 3)}
+
+    def save(self) -> None:
+        if self.hits or self.misses:
+            print(f"LOCATION CACHE - {self.stats()}")
+        if not self.path:
+            return
+        with self._lock:
+            data = dict(self.cache)
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False)
+        os.replace(tmp_path, self.path)
+
+
+location_resolver = LocationResolver()
+atexit.register(location_resolver.save)
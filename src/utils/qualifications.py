@@ -0,0 +1,98 @@
+from src.utils import static
+from src.utils.text import normalize_text
+
+
+def _build_keywords() -> list[tuple[str, str]]:
+    """(keyword, qualification) in priority order, the first keyword found wins.
+
+    Padded keywords (" bachelor ") must appear as a whole word.
+    """
+    keywords = []
+    for qualification in static.qualifications:
+        qual_lower = normalize_text(qualification).lower()
+        keywords.append((qual_lower, qualification))
+
+        # Recherche flexible sur la partie principale: "Bachelor's (B.A.)" -> " bachelor "
+        main_part = qual_lower.split("(")[0].strip()
+        main_keyword = main_part.replace("'s", "").replace("'s", "").strip()
+        if len(main_keyword) > 3:
+            keywords.append((f" {main_keyword} ", qualification))
+
+    # Mappings personnalisés pour les valeurs qui ne sont pas dans la liste
+    custom_mappings = [
+        # High School variations
+        ("high school diploma", "High School (S.S.C.E)"),
+        ("high school diploma or ged", "High School (S.S.C.E)"),
+        ("high school diploma or g.e.d", "High School (S.S.C.E)"),
+        ("ged", "High School (S.S.C.E)"),
+        ("g.e.d", "High School (S.S.C.E)"),
+        ("secondary school", "High School (S.S.C.E)"),
+        ("high school certificate", "High School (S.S.C.E)"),
+        ("ssce", "High School (S.S.C.E)"),
+
+        # Associate variations
+        ("associate degree", "Associate"),
+        ("associates degree", "Associate"),
+        ("associate's", "Associate"),
+        ("associate", "Associate"),
+
+        # Bachelor variations
+        ("bachelor's", "Bachelor's (B.A.)"),
+        ("bachelors", "Bachelor's (B.A.)"),
+        ("bachelor's degree", "Bachelor's (B.A.)"),
+        ("bachelor degree", "Bachelor's (B.A.)"),
+        ("bachelor of arts", "Bachelor's (B.A.)"),
+        ("bachelor of science", "Bachelor's (B.Sc.)"),
+        ("bachelor of commerce", "Bachelor's (B.Com.)"),
+        ("bachelor of engineering", "Bachelor's (B.Eng.)"),
+        ("bachelor of education", "Bachelor's (B.Ed.)"),
+        ("bachelor of laws", "Bachelor's (LLB)"),
+    ]
+    keywords.extend(
+        (keyword, qualification) for keyword, qualification in custom_mappings
+        if qualification in static.qualifications
+    )
+    return keywords
+
+
+KEYWORDS = _build_keywords()
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+if ahocorasick is not None:
+    # Every keyword found in one pass over the text, the value is its priority
+    AUTOMATON = ahocorasick.Automaton()
+    for priority, (keyword, _) in reversed(list(enumerate(KEYWORDS))):
+        AUTOMATON.add_word(keyword, priority)
+    AUTOMATON.make_automaton()
+else:
+    AUTOMATON = None
+
+
+def _best_priority(text: str) -> int:
+    if AUTOMATON is None:
+        # Without pyahocorasick: substring search in priority order, C speed per keyword
+        for priority, (keyword, _) in enumerate(KEYWORDS):
+            if keyword in text:
+                return priority
+        return len(KEYWORDS)
+
+    best = len(KEYWORDS)
+    for _, priority in AUTOMATON.iter(text):
+        if priority < best:
+            best = priority
+            if best == 0:
+                break
+    return best
+
+
+def extract_qualification(jobdescription: str) -> str:
+    """Highest priority qualification mentioned in a job description, or "General"."""
+    if not jobdescription:
+        return "General"
+
+    best = _best_priority(f" {normalize_text(jobdescription).lower()} ")
+    return KEYWORDS[best][1] if best < len(KEYWORDS) else "General"
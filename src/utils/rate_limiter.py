@@ -0,0 +1,181 @@
+import asyncio
+import threading
+import time
+from urllib.parse import urlparse
+
+import httpx
+from config.config import ADAPTIVE_RATE, RATE_LIMIT_DEFAULT, RATE_LIMITS
+
+
+class TokenBucket:
+    """Allow `rate` requests per second, with bursts of up to `burst` requests.
+
+    The rate is adaptive: slow_down() halves it when the host starts
+    throttling and speed_up() brings it back towards the configured rate.
+    An `adaptive` bucket was only created because the host throttled us,
+    it is dropped once it recovered, see RateLimiter.succeeded().
+    """
+
+    def __init__(self, rate: float, burst: int = 1, adaptive: bool = False) -> None:
+        self.adaptive = adaptive
+        self.rate = rate
+        self.max_rate = rate
+        self.min_rate = rate / 32
+        self.burst = max(1, burst)
+        self._slowed_at = 0.0
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def reserve(self) -> float:
+        """Take a token and return how many seconds the caller must wait before using it.
+
+        The balance may go negative: each waiter books the next free slot, so
+        concurrent workers are spread out instead of all waking up together.
+        """
+        with self._lock:
+            self._refill()
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+    def pause(self, seconds: float) -> None:
+        """Hold every request to this host for `seconds` (e.g. a Retry-After)"""
+        with self._lock:
+            self._refill()
+            self._tokens = min(self._tokens, 0.0) - seconds * self.rate
+
+    def slow_down(self) -> None:
+        with self._lock:
+            # Workers throttled together only count once per second
+            if self._updated - self._slowed_at < 1:
+                return
+            self._refill()
+            self._slowed_at = self._updated
+            self.rate = max(self.min_rate, self.rate / 2)
+
+    def speed_up(self) -> bool:
+        """Raise the rate, True once it is back to max_rate with no pause pending"""
+        with self._lock:
+            self._refill()
+            self.rate = min(self.max_rate, self.rate + self.max_rate / 20)
+            return self.rate >= self.max_rate and self._tokens >= 0
+
+    def acquire(self) -> None:
+        delay = self.reserve()
+        if delay:
+            time.sleep(delay)
+
+    async def acquire_async(self) -> None:
+        delay = self.reserve()
+        if delay:
+            await asyncio.sleep(delay)
+
+
+class RateLimiter:
+    """Process-wide registry with one token bucket per host.
+
+    Hosts without a declared limit are not throttled, unless
+    RATE_LIMIT_DEFAULT is set. Limits from the RATE_LIMITS environment
+    variable always win over the ones declared by the scrapers.
+    """
+
+    def __init__(self) -> None:
+        self._buckets: dict[str, TokenBucket | None] = {}
+        self._lock = threading.Lock()
+        for host, (rate, burst) in RATE_LIMITS.items():
+            self._buckets[host] = TokenBucket(rate, burst)
+
+    def configure(self, host: str, rate: float, burst: int = 1) -> None:
+        """Declare a limit for a host, the first declaration wins"""
+        if not host:
+            return
+        with self._lock:
+            bucket = self._buckets.get(host)
+            if bucket is None or bucket.adaptive:
+                self._buckets[host] = TokenBucket(rate, burst)
+
+    def bucket(self, host: str) -> TokenBucket | None:
+        bucket = self._buckets.get(host)
+        if bucket is None and RATE_LIMIT_DEFAULT > 0:
+            with self._lock:
+                bucket = self._buckets.get(host)
+                if bucket is None:
+                    bucket = self._buckets[host] = TokenBucket(RATE_LIMIT_DEFAULT, 1)
+        return bucket
+
+    def throttled(self, host: str, retry_after: float | None = None) -> None:
+        """The host answered 429/503: lower its rate and honour Retry-After.
+
+        Hosts without a declared limit get an adaptive bucket on their first
+        throttle, until they recover.
+        """
+        bucket = self.bucket(host)
+        if bucket is None:
+            with self._lock:
+                bucket = self._buckets.get(host)
+                if bucket is None:
+                    bucket = self._buckets[host] = TokenBucket(ADAPTIVE_RATE, 1, adaptive=True)
+        bucket.slow_down()
+        if retry_after:
+            bucket.pause(retry_after)
+
+    def succeeded(self, host: str) -> None:
+        bucket = self._buckets.get(host)
+        if bucket and bucket.speed_up() and bucket.adaptive:
+            # Back to full speed: the host is no longer throttled, as before its first 429
+            with self._lock:
+                if self._buckets.get(host) is bucket:
+                    del self._buckets[host]
+
+    def acquire(self, url: str) -> None:
+        """Block until a request to this url is allowed"""
+        bucket = self.bucket(urlparse(url).netloc)
+        if bucket:
+            bucket.acquire()
+
+    async def acquire_async(self, url: str) -> None:
+        bucket = self.bucket(urlparse(url).netloc)
+        if bucket:
+            await bucket.acquire_async()
+
+
+rate_limiter = RateLimiter()
+
+
+class RateLimitedTransport(httpx.BaseTransport):
+    """Wait for the host's token bucket before each request that reaches the network"""
+
+    def __init__(self, transport: httpx.BaseTransport, limiter: RateLimiter = rate_limiter) -> None:
+        self.transport = transport
+        self.limiter = limiter
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        bucket = self.limiter.bucket(request.url.netloc.decode())
+        if bucket:
+            bucket.acquire()
+        return self.transport.handle_request(request)
+
+    def close(self) -> None:
+        self.transport.close()
+
+
+class AsyncRateLimitedTransport(httpx.AsyncBaseTransport):
+    def __init__(self, transport: httpx.AsyncBaseTransport, limiter: RateLimiter = rate_limiter) -> None:
+        self.transport = transport
+        self.limiter = limiter
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        bucket = self.limiter.bucket(request.url.netloc.decode())
+        if bucket:
+            await bucket.acquire_async()
+        return await self.transport.handle_async_request(request)
+
+    async def aclose(self) -> None:
+        await self.transport.aclose()
@@ -0,0 +1,147 @@
+import asyncio
+import random
+import time
+from collections.abc import Awaitable, Callable
+from email.utils import parsedate_to_datetime
+from datetime import datetime, timezone
+from typing import TypeVar
+
+import httpx
+import requests
+from config.config import HTTP_BACKOFF, HTTP_MAX_BACKOFF, HTTP_RETRIES
+from src.utils.rate_limiter import RateLimiter, rate_limiter
+
+R = TypeVar("R")
+
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+# Statuses meaning "you are going too fast": the host rate is lowered
+THROTTLE_STATUSES = {429, 503}
+RETRY_EXCEPTIONS = (
+    httpx.TimeoutException,
+    httpx.NetworkError,
+    httpx.RemoteProtocolError,
+    requests.Timeout,
+    requests.ConnectionError,
+)
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Retry-After is either a number of seconds or an HTTP date"""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+
+class RetryPolicy:
+    """Retry timeouts, 429 and 5xx with exponential backoff and full jitter.
+
+    Every response is also reported to the rate limiter, so a host that
+    starts throttling is slowed down for all workers and sped up again
+    once it answers normally.
+    """
+
+    def __init__(
+        self,
+        retries: int = HTTP_RETRIES,
+        backoff: float = HTTP_BACKOFF,
+        max_backoff: float = HTTP_MAX_BACKOFF,
+        limiter: RateLimiter = rate_limiter,
+    ) -> None:
+        self.retries = retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.limiter = limiter
+
+    def delay(self, attempt: int, retry_after: float | None = None) -> float:
+        if retry_after is not None:
+            return min(retry_after, self.max_backoff)
+        return random.uniform(0, min(self.max_backoff, self.backoff * 2 ** attempt))
+
+    def _check(self, response, host: str, attempt: int) -> float | None:
+        """Return the delay before the next attempt, None if the response is final"""
+        status = response.status_code
+        retry_after = parse_retry_after(response.headers.get("Retry-After"))
+        if status in THROTTLE_STATUSES:
+            self.limiter.throttled(host, retry_after)
+        elif status < 500:
+            self.limiter.succeeded(host)
+
+        if status not in RETRY_STATUSES or attempt >= self.retries:
+            return None
+        print(f"HTTP {status} on {host} -> retry {attempt + 1}/{self.retries}")
+        return self.delay(attempt, retry_after)
+
+    def run(self, send: Callable[[], R], host: str) -> R:
+        """Call `send` until it returns a final response or the retries are exhausted"""
+        attempt = 0
+        while True:
+            try:
+                response = send()
+            except RETRY_EXCEPTIONS as e:
+                if attempt >= self.retries:
+                    raise
+                print(f"{type(e).__name__} on {host} -> retry {attempt + 1}/{self.retries}")
+                time.sleep(self.delay(attempt))
+                attempt += 1
+                continue
+
+            delay = self._check(response, host, attempt)
+            if delay is None:
+                return response
+            response.close()
+            time.sleep(delay)
+            attempt += 1
+
+    async def arun(self, send: Callable[[], Awaitable[R]], host: str) -> R:
+        attempt = 0
+        while True:
+            try:
+                response = await send()
+            except RETRY_EXCEPTIONS as e:
+                if attempt >= self.retries:
+                    raise
+                print(f"{type(e).__name__} on {host} -> retry {attempt + 1}/{self.retries}")
+                await asyncio.sleep(self.delay(attempt))
+                attempt += 1
+                continue
+
+            delay = self._check(response, host, attempt)
+            if delay is None:
+                return response
+            await response.aclose()
+            await asyncio.sleep(delay)
+            attempt += 1
+
+
+class RetryTransport(httpx.BaseTransport):
+    def __init__(self, transport: httpx.BaseTransport, policy: RetryPolicy | None = None) -> None:
+        self.transport = transport
+        self.policy = policy or RetryPolicy()
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        return self.policy.run(lambda: self.transport.handle_request(request), request.url.netloc.decode())
+
+    def close(self) -> None:
+        self.transport.close()
+
+
+class AsyncRetryTransport(httpx.AsyncBaseTransport):
+    def __init__(self, transport: httpx.AsyncBaseTransport, policy: RetryPolicy | None = None) -> None:
+        self.transport = transport
+        self.policy = policy or RetryPolicy()
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        return await self.policy.arun(lambda: self.transport.handle_async_request(request), request.url.netloc.decode())
+
+    async def aclose(self) -> None:
+        await self.transport.aclose()
@@ -0,0 +1,5 @@
+def normalize_text(text: str) -> str:
+    """Normalise les caractères typographiques (apostrophes, tirets)"""
+    if not text:
+        return ""
+    return text.replace("'", "'").replace("'", "'").replace("–", "-").replace("—", "-").strip()